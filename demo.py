@@ -5,26 +5,32 @@ Demo script for VibeQA Generator - 90 second demonstration
 
 import os
 import sys
-import subprocess
 import json
+import shlex
 from pathlib import Path
 
+from src.core import create_engine
+from src.frameworks.registry import get_adapter
+from src.utils.file_io import write_text_file
 
-def run_command(cmd: str, description: str) -> str:
-    """Run a command and return its output."""
-    print(f"\n🔄 {description}")
-    print(f"Command: {cmd}")
-    print("-" * 60)
-    
-    try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=True)
-        output = result.stdout.strip()
-        print(output)
-        return output
-    except subprocess.CalledProcessError as e:
-        print(f"Error: {e}")
-        print(f"Stderr: {e.stderr}")
-        return ""
+
+BASE_URL = "https://example.com"
+TAGS = ["auth", "email-validation", "negative"]
+OUTPUT_DIR = Path("examples/outputs/demo")
+
+# (framework, description, output filename)
+DEMO_JOBS = [
+    ("rainforest", "Generating Rainforest JSON", "invalid_email_signup.json"),
+    ("cypress", "Generating Cypress Test", "invalid_email_signup.cy.js"),
+    ("gherkin", "Generating Gherkin Feature", "invalid_email_signup.feature"),
+]
+
+
+def cli_command(scenario: str, framework: str, out_path: Path) -> str:
+    """Equivalent CLI command for a demo step, for display."""
+    args = [scenario, "--framework", framework, "--base-url", BASE_URL,
+            "--tags", ",".join(TAGS), "--out", str(out_path)]
+    return f"python -m src.cli {' '.join(shlex.quote(arg) for arg in args)}"
 
 
 def main():
@@ -44,14 +50,27 @@ def main():
     print(f"\n📝 Demo Scenario:")
     print(f'"{scenario}"')
     
-    # Generate Rainforest JSON
-    rainforest_cmd = f'python -m src.cli "{scenario}" --framework rainforest --base-url https://example.com --tags "auth,email-validation,negative" --out examples/outputs/demo/invalid_email_signup.json'
-    
     # Create output directory
-    Path("examples/outputs/demo").mkdir(parents=True, exist_ok=True)
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     
-    rainforest_output = run_command(rainforest_cmd, "Generating Rainforest JSON")
+    # Generate the framework-agnostic test once; only the adapters differ
+    print("\n🤖 Generating test JSON (one LLM call shared by all frameworks)")
+    try:
+        test_json = create_engine().generate_test(scenario=scenario, base_url=BASE_URL, tags=TAGS)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    outputs = {}
+    for framework, description, filename in DEMO_JOBS:
+        print(f"\n🔄 {description}")
+        print(f"Command: {cli_command(scenario, framework, OUTPUT_DIR / filename)}")
+        print("-" * 60)
+        outputs[framework] = get_adapter(framework).convert(test_json)
+        write_text_file(outputs[framework], OUTPUT_DIR / filename)
+        print(outputs[framework])
     
+    rainforest_output = outputs["rainforest"]
     if rainforest_output:
         print(f"\n📄 Generated JSON Structure:")
         try:
@@ -63,16 +82,6 @@ def main():
         except json.JSONDecodeError:
             print("  (Could not parse JSON structure)")
     
-    # Generate Cypress version
-    cypress_cmd = f'python -m src.cli "{scenario}" --framework cypress --base-url https://example.com --tags "auth,email-validation,negative" --out examples/outputs/demo/invalid_email_signup.cy.js'
-    
-    cypress_output = run_command(cypress_cmd, "Generating Cypress Test")
-    
-    # Generate Gherkin version  
-    gherkin_cmd = f'python -m src.cli "{scenario}" --framework gherkin --base-url https://example.com --tags "auth,email-validation,negative" --out examples/outputs/demo/invalid_email_signup.feature'
-    
-    gherkin_output = run_command(gherkin_cmd, "Generating Gherkin Feature")
-    
     print(f"\n🎉 Demo Complete!")
     print("=" * 60)
     print("✅ Same input scenario generated structured outputs for 3 frameworks")
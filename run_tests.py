@@ -1,16 +1,10 @@
 #!/usr/bin/env python3
 """Test runner for VibeQA Generator."""
 
-import subprocess
 import sys
 from pathlib import Path
 
-
-def run_command(cmd: str) -> bool:
-    """Run a command and return success status."""
-    print(f"Running: {cmd}")
-    result = subprocess.run(cmd, shell=True)
-    return result.returncode == 0
+import pytest
 
 
 def main():
@@ -22,7 +16,8 @@ def main():
     
     # Run unit tests
     print("\n1. Running unit tests...")
-    if not run_command("python -m pytest tests/ -v"):
+    print("Running: pytest tests/ -v")
+    if pytest.main(["tests/", "-v"]) != 0:
         success = False
         print("❌ Unit tests failed")
     else:
@@ -1,22 +1,29 @@
 """Command-line interface for VibeQA Generator."""
 
+import asyncio
 import sys
 import os
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 import click
 
-from .core import create_engine
+from .core import PromptEngine, create_engine
+from .frameworks.base import FrameworkAdapter
 from .frameworks.registry import get_adapter, get_available_frameworks
-from .utils.file_io import write_text_file
+from .utils.file_io import write_text_file, write_batch
 from .utils.slugify import slugify
 
 
+# Framework names are fixed at import; compute them once for every option below
+_FRAMEWORKS = tuple(get_available_frameworks())
+_FRAMEWORK_CHOICE = click.Choice(_FRAMEWORKS, case_sensitive=False)
+
+
 @click.command()
 @click.argument('scenario', type=str)
 @click.option('--framework', '-f', 
-              type=click.Choice(get_available_frameworks(), case_sensitive=False),
+              type=_FRAMEWORK_CHOICE,
               required=True,
               help='Target framework for test generation')
 @click.option('--base-url', '-u',
@@ -39,9 +46,13 @@ from .utils.slugify import slugify
               type=float,
               default=0.2,
               help='Temperature for LLM generation (default: 0.2)')
+@click.option('--no-cache',
+              is_flag=True,
+              help='Bypass the on-disk LLM response cache')
 def main(scenario: str, framework: str, base_url: Optional[str] = None,
          tags: Optional[str] = None, out: Optional[str] = None,
-         strict: bool = False, model: str = 'gpt-4o', temperature: float = 0.2):
+         strict: bool = False, model: str = 'gpt-4o', temperature: float = 0.2,
+         no_cache: bool = False):
     """
     Generate test artifacts from plain-English scenarios.
     
@@ -67,8 +78,11 @@ def main(scenario: str, framework: str, base_url: Optional[str] = None,
             scenario=scenario,
             base_url=base_url,
             tags=tag_list,
-            strict_mode=strict
+            strict_mode=strict,
+            no_cache=no_cache
         )
+        if engine.last_cache_hit:
+            click.echo("INFO: cache hit", err=True)
         
         # Get framework adapter
         adapter = get_adapter(framework)
@@ -93,10 +107,60 @@ def main(scenario: str, framework: str, base_url: Optional[str] = None,
         sys.exit(1)
 
 
+async def _process_batch(engine: PromptEngine, adapter: FrameworkAdapter, scenarios: List[str],
+                         output_path: Path, base_url: Optional[str], strict: bool,
+                         no_cache: bool, concurrency: int, bundle: Optional[Path] = None) -> None:
+    """
+    Generate and write tests for all scenarios, at most `concurrency` at a time.
+    
+    With a bundle path, outputs are collected and written into that one tar file
+    at the end instead of one file per scenario under output_path.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    total = len(scenarios)
+    extension = adapter.get_file_extension()
+    bundled: List[Optional[Tuple[Path, str]]] = [None] * total
+    
+    async def process(i: int, scenario: str) -> None:
+        async with semaphore:
+            click.echo(f"Processing scenario {i}/{total}...", err=True)
+            
+            try:
+                # Generate test
+                test_json = await engine.generate_test_async(
+                    scenario=scenario,
+                    base_url=base_url,
+                    strict_mode=strict,
+                    no_cache=no_cache
+                )
+                
+                # Convert and save
+                output_content = adapter.convert(test_json)
+                
+                # Generate filename from scenario
+                scenario_id = slugify(scenario[:50])  # First 50 chars
+                if bundle is not None:
+                    file_path = Path(f"{scenario_id}{extension}")
+                    bundled[i - 1] = (file_path, output_content)
+                else:
+                    file_path = output_path / f"{scenario_id}{extension}"
+                    write_text_file(output_content, file_path)
+                click.echo(f"  [{i}/{total}] -> {file_path}", err=True)
+                
+            except Exception as e:
+                click.echo(f"  [{i}/{total}] -> Error: {e}", err=True)
+    
+    await asyncio.gather(*(process(i, scenario) for i, scenario in enumerate(scenarios, 1)))
+    
+    if bundle is not None:
+        write_batch([item for item in bundled if item is not None], bundle)
+        click.echo(f"Bundle written to: {bundle}", err=True)
+
+
 @click.command()
 @click.argument('scenario_file', type=click.Path(exists=True))
 @click.option('--framework', '-f',
-              type=click.Choice(get_available_frameworks(), case_sensitive=False),
+              type=_FRAMEWORK_CHOICE,
               required=True,
               help='Target framework for test generation')
 @click.option('--base-url', '-u',
@@ -113,8 +177,19 @@ def main(scenario: str, framework: str, base_url: Optional[str] = None,
               type=str,
               default='gpt-4o',
               help='LLM model to use (default: gpt-4o)')
+@click.option('--no-cache',
+              is_flag=True,
+              help='Bypass the on-disk LLM response cache')
+@click.option('--concurrency', '-c',
+              type=click.IntRange(min=1),
+              default=8,
+              help='Maximum number of scenarios generated at once (default: 8)')
+@click.option('--bundle',
+              type=click.Path(dir_okay=False),
+              help='Write all outputs into this single .tar file instead of --output-dir')
 def batch(scenario_file: str, framework: str, base_url: Optional[str] = None,
-          output_dir: str = 'output', strict: bool = False, model: str = 'gpt-4o'):
+          output_dir: str = 'output', strict: bool = False, model: str = 'gpt-4o',
+          no_cache: bool = False, concurrency: int = 8, bundle: Optional[str] = None):
     """
     Generate tests from a batch file containing multiple scenarios.
     
@@ -139,33 +214,12 @@ def batch(scenario_file: str, framework: str, base_url: Optional[str] = None,
         adapter = get_adapter(framework)
         
         output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+        bundle_path = Path(bundle) if bundle else None
+        if bundle_path is None:
+            output_path.mkdir(parents=True, exist_ok=True)
         
-        for i, scenario in enumerate(scenarios, 1):
-            click.echo(f"Processing scenario {i}/{len(scenarios)}...", err=True)
-            
-            try:
-                # Generate test
-                test_json = engine.generate_test(
-                    scenario=scenario,
-                    base_url=base_url,
-                    strict_mode=strict
-                )
-                
-                # Convert and save
-                output_content = adapter.convert(test_json)
-                
-                # Generate filename from scenario
-                scenario_id = slugify(scenario[:50])  # First 50 chars
-                filename = f"{scenario_id}{adapter.get_file_extension()}"
-                file_path = output_path / filename
-                
-                write_text_file(output_content, file_path)
-                click.echo(f"  -> {file_path}", err=True)
-                
-            except Exception as e:
-                click.echo(f"  -> Error: {e}", err=True)
-                continue
+        asyncio.run(_process_batch(engine, adapter, scenarios, output_path, base_url,
+                                   strict, no_cache, concurrency, bundle_path))
         
         click.echo("Batch processing complete!", err=True)
         
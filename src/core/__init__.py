@@ -3,10 +3,12 @@
 from .engine import PromptEngine, create_engine
 from .validator import TestValidator, ValidationResult, validate_test_json
 from .schema import RainforestTest, Environment, Variable, TestStep
+from .cache import ResponseCache
 
 __all__ = [
     'PromptEngine', 'create_engine',
     'TestValidator', 'ValidationResult', 'validate_test_json',
-    'RainforestTest', 'Environment', 'Variable', 'TestStep'
+    'RainforestTest', 'Environment', 'Variable', 'TestStep',
+    'ResponseCache'
 ]
 
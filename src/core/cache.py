@@ -0,0 +1,54 @@
+"""On-disk cache for LLM responses."""
+
+import hashlib
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import orjson
+
+
+DEFAULT_CACHE_DIR = Path(".cache") / "vibeqa"
+
+
+class ResponseCache:
+    """Exact-match cache of raw LLM responses keyed by the rendered request."""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Directory holding cached responses (defaults to .cache/vibeqa)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """
+        Build a deterministic cache key for a request.
+
+        Args:
+            request: Everything that influences the LLM output (prompts, model, sampling params)
+
+        Returns:
+            Hex-encoded SHA-256 digest of the canonical request
+        """
+        return hashlib.sha256(orjson.dumps(request, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached raw response for a key, or None on a miss."""
+        cache_file = self.cache_dir / f"{key}.json"
+        try:
+            return orjson.loads(cache_file.read_bytes())["raw_response"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, key: str, raw_response: str) -> None:
+        """Store a raw response under a key."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file = self.cache_dir / f"{key}.json"
+            cache_file.write_bytes(orjson.dumps({"raw_response": raw_response}))
+        except Exception as e:
+            # Don't fail the main operation if caching fails
+            print(f"Warning: Failed to write cache: {e}")
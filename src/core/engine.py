@@ -1,17 +1,135 @@
 """LLM engine integration for VibeQA Generator."""
 
+import gzip
+import itertools
 import os
-import json
-from typing import Dict, Any, Optional, List
+import re
+from functools import lru_cache
+from typing import Dict, Any, Generator, Optional, List, Tuple
 from datetime import datetime
 from pathlib import Path
+from string import Formatter
 
-try:
-    from openai import OpenAI
-except ImportError:
-    raise ImportError("OpenAI package is required. Install with: pip install openai")
+import orjson
 
-from .validator import TestValidator, ValidationResult
+from .validator import TestValidator, ValidationResult, validate_test_json
+from .cache import ResponseCache
+
+
+def _import_openai() -> Any:
+    """Import the OpenAI SDK on first use to keep CLI start-up fast."""
+    try:
+        import openai
+    except ImportError:
+        raise ImportError("OpenAI package is required. Install with: pip install openai")
+    return openai
+
+
+# Whitespace then a closing bracket, i.e. what follows a trailing comma
+_CLOSING_BRACKET_RE = re.compile(r'\s*[}\]]')
+
+# Sequence number appended to run IDs; next() on a count is atomic in CPython
+_RUN_SEQUENCE = itertools.count()
+
+# Stream events that end a response without usable output
+_STREAM_FAILURE_EVENTS = frozenset({'error', 'response.failed', 'response.incomplete'})
+
+# (input messages, previous_response_id) for one Responses API call
+_CompletionRequest = Tuple[List[Dict[str, str]], Optional[str]]
+
+
+class JsonObjectScanner:
+    """Accumulates streamed text and detects when the top-level JSON object closes."""
+    
+    def __init__(self):
+        self._parts: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self.complete = False
+    
+    @property
+    def text(self) -> str:
+        """Text received so far, truncated after the closing brace once complete."""
+        return "".join(self._parts)
+    
+    def feed(self, chunk: str) -> bool:
+        """
+        Add a chunk of streamed text.
+        
+        Returns:
+            True once the top-level object is complete; later chunks are ignored
+        """
+        if self.complete or not chunk:
+            return self.complete
+        
+        for i, char in enumerate(chunk):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = self._depth > 0
+            elif char == '{':
+                self._depth += 1
+            elif char == '}' and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._parts.append(chunk[:i + 1])
+                    self.complete = True
+                    return True
+        
+        self._parts.append(chunk)
+        return False
+
+
+def _remove_trailing_commas(text: str) -> str:
+    """Drop commas directly before a closing bracket, leaving string contents untouched."""
+    parts = []
+    start = 0
+    in_string = False
+    escaped = False
+    for i, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == ',' and _CLOSING_BRACKET_RE.match(text, i + 1):
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return "".join(parts)
+
+
+def _stream_failure_message(event: Any) -> str:
+    """Describe an error, response.failed or response.incomplete stream event."""
+    if event.type == 'error':
+        return f"Stream error: {getattr(event, 'message', None) or 'unknown error'}"
+    response = getattr(event, 'response', None)
+    if event.type == 'response.failed':
+        error = getattr(response, 'error', None)
+        return f"Response failed: {getattr(error, 'message', None) or 'unknown error'}"
+    details = getattr(response, 'incomplete_details', None)
+    return f"Response incomplete: {getattr(details, 'reason', None) or 'unknown reason'}"
+
+
+@lru_cache(maxsize=8)
+def _load_prompt_cached(filename: str) -> str:
+    """Read a prompt file once per process."""
+    prompt_path = Path("prompts") / filename
+    try:
+        with open(prompt_path, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
 
 
 class PromptEngine:
@@ -32,61 +150,151 @@ class PromptEngine:
         if not self.api_key:
             raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
         
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = _import_openai().OpenAI(api_key=self.api_key)
+        self.async_client = None
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.validator = TestValidator()
+        self.cache = ResponseCache()
+        self.last_cache_hit = False
+        self._log_file = None
         
-        # Load prompts
+        # Load prompts. Invariant text is kept separate from the per-scenario
+        # template so every request shares an identical leading prefix, which
+        # OpenAI caches automatically once it reaches 1024 tokens.
         self.system_prompt = self._load_prompt("system_prompt_v1.txt")
-        self.user_prompt_template = self._load_prompt("user_prompt_template_v1.txt")
+        self.static_user_prefix = self._load_prompt("user_prompt_static_v1.txt")
+        self.user_prompt_template = self._load_prompt("user_prompt_dynamic_v1.txt")
+        # Parse the template into (literal, field) pairs once rather than on every call
+        self._user_prompt_parts = [
+            (literal, field_name)
+            for literal, field_name, _, _ in Formatter().parse(self.user_prompt_template)
+        ]
     
     def _load_prompt(self, filename: str) -> str:
         """Load prompt template from file."""
-        prompt_path = Path("prompts") / filename
-        try:
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                return f.read().strip()
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
+        return _load_prompt_cached(filename)
     
-    def generate_test(self, scenario: str, base_url: Optional[str] = None,
-                     tags: Optional[List[str]] = None, variables: Optional[Dict[str, str]] = None,
-                     strict_mode: bool = False) -> Dict[str, Any]:
+    def _render_user_prompt(self, values: Dict[str, str]) -> str:
+        """Fill the pre-parsed user prompt template with per-scenario values."""
+        return "".join(
+            literal if field_name is None else literal + values[field_name]
+            for literal, field_name in self._user_prompt_parts
+        )
+    
+    def _build_messages(self, user_prompt: str) -> List[Dict[str, str]]:
+        """Build chat messages with the static prefix first and the scenario last."""
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": self.static_user_prefix},
+            {"role": "user", "content": user_prompt}
+        ]
+    
+    def _build_retry_messages(self, user_prompt: str, raw_response: str, correction_prompt: str,
+                              response_id: Optional[str]) -> List[Dict[str, str]]:
         """
-        Generate a test from a scenario description.
+        Build the input asking the model to correct a rejected response.
         
-        Args:
-            scenario: Plain English scenario description
-            base_url: Base URL for the application
-            tags: List of tags to include
-            variables: Variables available for the test
-            strict_mode: Whether to use strict validation
+        When the first response is stored server-side (response_id is set), only
+        the correction is sent and the earlier turns are referenced by ID.
+        """
+        correction = {"role": "user", "content": correction_prompt}
+        if response_id is not None:
+            return [correction]
+        return self._build_messages(user_prompt) + [
+            {"role": "assistant", "content": raw_response},
+            correction
+        ]
+    
+    def _request_params(self, messages: List[Dict[str, str]],
+                        previous_response_id: Optional[str]) -> Dict[str, Any]:
+        """Keyword arguments for a streamed Responses API request."""
+        params: Dict[str, Any] = {
+            "model": self.model,
+            "input": messages,
+            "temperature": self.temperature,
+            "max_output_tokens": self.max_tokens,
+            "top_p": 1.0,
+            "stream": True
+        }
+        if previous_response_id is not None:
+            params["previous_response_id"] = previous_response_id
+        return params
+    
+    def _complete(self, messages: List[Dict[str, str]],
+                  previous_response_id: Optional[str] = None) -> Tuple[str, Optional[str]]:
+        """
+        Stream a response, stopping as soon as the JSON object is complete.
         
         Returns:
-            Dictionary containing the generated test JSON
-            
+            Tuple of (response_text, response_id)
+        
         Raises:
-            ValueError: If generation or validation fails
+            ValueError: If the stream reports an error, failed or incomplete response
         """
+        stream = self.client.responses.create(**self._request_params(messages, previous_response_id))
+        scanner = JsonObjectScanner()
+        response_id = None
+        try:
+            for event in stream:
+                if event.type == 'response.created':
+                    response_id = event.response.id
+                elif event.type == 'response.output_text.delta':
+                    if scanner.feed(event.delta):
+                        break
+                elif event.type in _STREAM_FAILURE_EVENTS:
+                    raise ValueError(_stream_failure_message(event))
+        finally:
+            # Closing early cancels the rest of the decode
+            stream.close()
+        return scanner.text, response_id
+    
+    async def _complete_async(self, messages: List[Dict[str, str]],
+                              previous_response_id: Optional[str] = None) -> Tuple[str, Optional[str]]:
+        """Stream a response without blocking the event loop."""
+        if self.async_client is None:
+            self.async_client = _import_openai().AsyncOpenAI(api_key=self.api_key)
+        stream = await self.async_client.responses.create(
+            **self._request_params(messages, previous_response_id))
+        scanner = JsonObjectScanner()
+        response_id = None
+        try:
+            async for event in stream:
+                if event.type == 'response.created':
+                    response_id = event.response.id
+                elif event.type == 'response.output_text.delta':
+                    if scanner.feed(event.delta):
+                        break
+                elif event.type in _STREAM_FAILURE_EVENTS:
+                    raise ValueError(_stream_failure_message(event))
+        finally:
+            await stream.close()
+        return scanner.text, response_id
+    
+    def _prepare_run(self, scenario: str, base_url: Optional[str], tags: Optional[List[str]],
+                     variables: Optional[Dict[str, str]]) -> Tuple[str, Dict[str, Any], str]:
+        """Render the user prompt and build the run log and cache key."""
         # Prepare prompt variables
         base_url_or_none = base_url or "None specified"
         tags_csv_or_empty = ",".join(tags) if tags else ""
-        variables_or_empty = json.dumps(variables) if variables else "None"
+        variables_or_empty = orjson.dumps(variables).decode() if variables else "None"
         
-        user_prompt = self.user_prompt_template.format(
-            scenario=scenario,
-            base_url_or_none=base_url_or_none,
-            tags_csv_or_empty=tags_csv_or_empty,
-            variables_or_empty=variables_or_empty
-        )
+        user_prompt = self._render_user_prompt({
+            "scenario": scenario,
+            "base_url_or_none": base_url_or_none,
+            "tags_csv_or_empty": tags_csv_or_empty,
+            "variables_or_empty": variables_or_empty
+        })
         
         # Log the request
-        run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        # Microseconds order runs by start time; the process-wide sequence number
+        # keeps IDs unique when concurrent runs read the same clock value
+        run_id = now.strftime("%Y%m%d_%H%M%S_%f") + f"_{next(_RUN_SEQUENCE):04d}"
         log_data = {
             "run_id": run_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "scenario": scenario,
             "base_url": base_url,
             "tags": tags,
@@ -95,72 +303,73 @@ class PromptEngine:
             "temperature": self.temperature
         }
         
-        # Generate initial response
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                top_p=1.0
-            )
-            
-            raw_response = response.choices[0].message.content
-            log_data["raw_response"] = raw_response
-            
-        except Exception as e:
-            log_data["error"] = str(e)
-            self._log_run(log_data)
-            raise ValueError(f"Failed to generate test: {str(e)}")
+        cache_key = self.cache.make_key({
+            "messages": self._build_messages(user_prompt),
+            "model": self.model,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens
+        })
         
-        # Validate response
+        return user_prompt, log_data, cache_key
+    
+    def _validate_response(self, raw_response: str, strict_mode: bool,
+                           log_data: Dict[str, Any], log_key: str) -> Tuple[Optional[Dict[str, Any]], ValidationResult]:
+        """Validate a raw response and record the outcome in the run log."""
         self.validator.strict_mode = strict_mode
         parsed_json, validation_result = self.validator.validate_raw_response(raw_response)
-        
-        log_data["parsed_json"] = parsed_json
-        log_data["validation_result"] = {
+        log_data[log_key] = {
             "success": validation_result.success,
             "errors": validation_result.errors,
             "warnings": validation_result.warnings
         }
+        return parsed_json, validation_result
+    
+    def _try_local_repair(self, raw_response: str, base_url: Optional[str],
+                          strict_mode: bool) -> Optional[Tuple[Dict[str, Any], ValidationResult]]:
+        """
+        Fix shallow defects in a rejected response without another LLM call.
         
-        # Retry once if validation failed
-        if not validation_result.success and parsed_json is None:
-            correction_prompt = self.validator.generate_correction_prompt(raw_response, validation_result)
-            
+        Takes the outermost {...} (dropping code fences or prose around it),
+        removes trailing commas only if it does not parse as is, and fills in
+        a missing environment.base_url from the caller's base_url.
+        
+        Returns:
+            Tuple of (parsed_json, validation_result) if the repaired response
+            validates, otherwise None
+        """
+        start, end = raw_response.find('{'), raw_response.rfind('}')
+        if start == -1 or end < start:
+            return None
+        candidate = raw_response[start:end + 1]
+        try:
+            data = orjson.loads(candidate)
+        except orjson.JSONDecodeError:
             try:
-                retry_response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": self.system_prompt},
-                        {"role": "user", "content": user_prompt},
-                        {"role": "assistant", "content": raw_response},
-                        {"role": "user", "content": correction_prompt}
-                    ],
-                    temperature=self.temperature,
-                    max_tokens=self.max_tokens,
-                    top_p=1.0
-                )
-                
-                retry_raw_response = retry_response.choices[0].message.content
-                log_data["retry_raw_response"] = retry_raw_response
-                
-                # Validate retry
-                parsed_json, validation_result = self.validator.validate_raw_response(retry_raw_response)
-                log_data["retry_validation_result"] = {
-                    "success": validation_result.success,
-                    "errors": validation_result.errors,
-                    "warnings": validation_result.warnings
-                }
-                
-            except Exception as e:
-                log_data["retry_error"] = str(e)
-                self._log_run(log_data)
-                raise ValueError(f"Failed to generate test on retry: {str(e)}")
+                data = orjson.loads(_remove_trailing_commas(candidate))
+            except orjson.JSONDecodeError:
+                return None
+        if not isinstance(data, dict):
+            return None
         
+        if base_url:
+            environment = data.setdefault('environment', {})
+            if isinstance(environment, dict) and not environment.get('base_url'):
+                environment['base_url'] = base_url
+        
+        validation_result = validate_test_json(data, strict_mode=strict_mode)
+        if not validation_result.success:
+            return None
+        return data, validation_result
+    
+    def _finish_run(self, parsed_json: Optional[Dict[str, Any]], validation_result: ValidationResult,
+                    log_data: Dict[str, Any], base_url: Optional[str], cache_key: str,
+                    raw_response: Optional[str]) -> Dict[str, Any]:
+        """
+        Log the run, cache the response and apply environment defaults.
+        
+        Args:
+            raw_response: Validated response to cache, or None to skip caching
+        """
         # Log the final result
         self._log_run(log_data)
         
@@ -169,6 +378,10 @@ class PromptEngine:
             error_msg = "Validation failed: " + "; ".join(validation_result.errors)
             raise ValueError(error_msg)
         
+        # Only cache responses that passed validation
+        if raw_response is not None:
+            self.cache.put(cache_key, raw_response)
+        
         # Set default base_url if not provided
         if base_url and 'environment' in parsed_json:
             parsed_json['environment']['base_url'] = base_url
@@ -177,22 +390,178 @@ class PromptEngine:
         
         return parsed_json
     
+    def _generation_steps(self, scenario: str, base_url: Optional[str], tags: Optional[List[str]],
+                          variables: Optional[Dict[str, str]], strict_mode: bool, no_cache: bool,
+                          track_cache_hit: bool
+                          ) -> Generator[_CompletionRequest, Tuple[str, Optional[str]], Dict[str, Any]]:
+        """
+        Run one generation, handing each completion request back to the caller.
+        
+        Yields (messages, previous_response_id) and expects the caller to send in
+        the (response_text, response_id) result, or to throw the completion error
+        in. The sync and async entry points differ only in how they complete a
+        request; cache lookup, validation, repair and retry all live here.
+        
+        Returns:
+            Dictionary containing the generated test JSON
+        """
+        user_prompt, log_data, cache_key = self._prepare_run(scenario, base_url, tags, variables)
+        
+        # Look up an identical earlier request
+        raw_response = None if no_cache else self.cache.get(cache_key)
+        cache_hit = raw_response is not None
+        if track_cache_hit:
+            self.last_cache_hit = cache_hit
+        log_data["cache_hit"] = cache_hit
+        
+        # Generate initial response
+        response_id = None
+        if raw_response is None:
+            try:
+                raw_response, response_id = yield self._build_messages(user_prompt), None
+                log_data["response_id"] = response_id
+            except Exception as e:
+                log_data["error"] = str(e)
+                self._log_run(log_data)
+                raise ValueError(f"Failed to generate test: {str(e)}")
+        
+        log_data["raw_response"] = raw_response
+        final_raw_response = raw_response
+        
+        # Validate response
+        parsed_json, validation_result = self._validate_response(
+            raw_response, strict_mode, log_data, "validation_result")
+        log_data["parsed_json"] = parsed_json
+        
+        # Try cheap local fixes before spending another API call
+        if not validation_result.success and parsed_json is None:
+            repaired = self._try_local_repair(raw_response, base_url, strict_mode)
+            if repaired is not None:
+                parsed_json, validation_result = repaired
+                log_data["local_repair"] = True
+        
+        # Retry once if validation failed
+        if not validation_result.success and parsed_json is None:
+            correction_prompt = self.validator.generate_correction_prompt(raw_response, validation_result)
+            
+            try:
+                try:
+                    retry_raw_response, _ = yield (
+                        self._build_retry_messages(user_prompt, raw_response, correction_prompt, response_id),
+                        response_id)
+                except Exception as e:
+                    if response_id is None:
+                        raise
+                    # The first stream was closed early, so the stored response it
+                    # points at may be unusable; resend the whole conversation instead
+                    log_data["chained_retry_error"] = str(e)
+                    retry_raw_response, _ = yield (
+                        self._build_retry_messages(user_prompt, raw_response, correction_prompt, None),
+                        None)
+            except Exception as e:
+                log_data["retry_error"] = str(e)
+                self._log_run(log_data)
+                raise ValueError(f"Failed to generate test on retry: {str(e)}")
+            
+            log_data["retry_raw_response"] = retry_raw_response
+            final_raw_response = retry_raw_response
+            
+            # Validate retry
+            parsed_json, validation_result = self._validate_response(
+                retry_raw_response, strict_mode, log_data, "retry_validation_result")
+        
+        cacheable = not no_cache and not cache_hit
+        return self._finish_run(parsed_json, validation_result, log_data, base_url, cache_key,
+                                final_raw_response if cacheable else None)
+    
+    def generate_test(self, scenario: str, base_url: Optional[str] = None,
+                     tags: Optional[List[str]] = None, variables: Optional[Dict[str, str]] = None,
+                     strict_mode: bool = False, no_cache: bool = False) -> Dict[str, Any]:
+        """
+        Generate a test from a scenario description.
+        
+        Args:
+            scenario: Plain English scenario description
+            base_url: Base URL for the application
+            tags: List of tags to include
+            variables: Variables available for the test
+            strict_mode: Whether to use strict validation
+            no_cache: Bypass the on-disk response cache
+        
+        Returns:
+            Dictionary containing the generated test JSON
+            
+        Raises:
+            ValueError: If generation or validation fails
+        """
+        steps = self._generation_steps(scenario, base_url, tags, variables, strict_mode, no_cache,
+                                       track_cache_hit=True)
+        reply, error = None, None
+        while True:
+            try:
+                messages, previous_response_id = steps.send(reply) if error is None else steps.throw(error)
+            except StopIteration as done:
+                return done.value
+            try:
+                reply, error = self._complete(messages, previous_response_id), None
+            except Exception as e:
+                reply, error = None, e
+    
+    async def generate_test_async(self, scenario: str, base_url: Optional[str] = None,
+                                  tags: Optional[List[str]] = None,
+                                  variables: Optional[Dict[str, str]] = None,
+                                  strict_mode: bool = False, no_cache: bool = False) -> Dict[str, Any]:
+        """
+        Generate a test without blocking, so several scenarios can run concurrently.
+        
+        Takes the same arguments as generate_test. Does not update last_cache_hit,
+        since concurrent calls would overwrite each other.
+        
+        Returns:
+            Dictionary containing the generated test JSON
+            
+        Raises:
+            ValueError: If generation or validation fails
+        """
+        steps = self._generation_steps(scenario, base_url, tags, variables, strict_mode, no_cache,
+                                       track_cache_hit=False)
+        reply, error = None, None
+        while True:
+            try:
+                messages, previous_response_id = steps.send(reply) if error is None else steps.throw(error)
+            except StopIteration as done:
+                return done.value
+            try:
+                reply, error = await self._complete_async(messages, previous_response_id), None
+            except Exception as e:
+                reply, error = None, e
+    
     def _log_run(self, log_data: Dict[str, Any]) -> None:
-        """Log run data to JSONL file."""
+        """Append run data as one gzip-compressed line of logs/runs.jsonl.gz."""
         try:
-            log_dir = Path("logs")
-            log_dir.mkdir(exist_ok=True)
+            if self._log_file is None:
+                log_dir = Path("logs")
+                log_dir.mkdir(exist_ok=True)
+                self._log_file = open(log_dir / "runs.jsonl.gz", 'ab', buffering=0)
             
-            log_file = log_dir / f"run_{log_data['run_id']}.jsonl"
-            with open(log_file, 'w', encoding='utf-8') as f:
-                json.dump(log_data, f, ensure_ascii=False, separators=(',', ':'))
-                f.write('\n')
+            # Each record is a complete gzip member written in one call, so the
+            # file stays readable (zcat, gzip.open) even if the process dies.
+            self._log_file.write(gzip.compress(orjson.dumps(log_data) + b'\n', compresslevel=6))
         except Exception as e:
             # Don't fail the main operation if logging fails
             print(f"Warning: Failed to write log: {e}")
 
 
+# Engines shared per (model, temperature) so callers reuse one HTTP connection pool
+_ENGINE_CACHE: Dict[Tuple[str, float], PromptEngine] = {}
+
+
 def create_engine(model: str = "gpt-4o", temperature: float = 0.2) -> PromptEngine:
-    """Create a configured PromptEngine instance."""
-    return PromptEngine(model=model, temperature=temperature)
+    """Create a configured PromptEngine instance, reusing one for identical settings."""
+    key = (model, temperature)
+    engine = _ENGINE_CACHE.get(key)
+    if engine is None:
+        engine = PromptEngine(model=model, temperature=temperature)
+        _ENGINE_CACHE[key] = engine
+    return engine
 
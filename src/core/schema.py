@@ -1,10 +1,35 @@
 """Schema definitions and validation for VibeQA Generator."""
 
 from typing import Dict, List, Optional, Any, Union
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 import re
 
 
+_KEBAB_RE = re.compile(r'^[a-z0-9]+(-[a-z0-9]+)*$')
+# Newline-terminated kebab-case lines; checks a whole joined tag list in one match
+_KEBAB_LINES_RE = re.compile(r'(?:[a-z0-9]+(?:-[a-z0-9]+)*\n)*\Z')
+_VAR_RE = re.compile(r'\{\{(\w+)\}\}')
+
+ALLOWED_ACTIONS = {
+    'navigate': ['target', 'expected_result'],
+    'wait_for_element': ['selector_type', 'selector', 'timeout_seconds', 'expected_result'],
+    'type': ['selector_type', 'selector', 'value', 'expected_result'],
+    'click': ['selector_type', 'selector', 'expected_result'],
+    'assert_element_text': ['selector_type', 'selector', 'match', 'value', 'expected_result'],
+    'assert_element_visible': ['selector_type', 'selector', 'expected_result'],
+    'assert_no_navigation': ['expected_result'],
+    'open_new_tab': ['target', 'expected_result'],
+    'switch_to_new_tab': ['expected_result'],
+}
+
+_MATCH_TYPES = ('equals', 'contains', 'regex')
+
+# TestStep fields that may contain {{variable}} references
+_STEP_STRING_FIELDS = (
+    'action', 'target', 'selector_type', 'selector', 'value', 'match', 'expected_result'
+)
+
+
 class Environment(BaseModel):
     """Environment configuration for test execution."""
     app_type: str = Field(default="web", pattern="^web$")
@@ -19,6 +44,8 @@ class Variable(BaseModel):
 
 class TestStep(BaseModel):
     """Individual test step with action and expected result."""
+    model_config = ConfigDict(frozen=True)
+
     action: str = Field(..., min_length=1)
     target: Optional[str] = None
     selector_type: Optional[str] = None
@@ -28,57 +55,61 @@ class TestStep(BaseModel):
     match: Optional[str] = None
     expected_result: str = Field(..., min_length=1)
 
-    @validator('selector_type')
-    def validate_selector_type(cls, v, values):
-        """Ensure selector_type is 'css' when selector is present."""
-        if 'selector' in values and values['selector'] is not None:
-            if v != 'css':
-                raise ValueError("selector_type must be 'css' when selector is present")
-        return v
+    @model_validator(mode='after')
+    def validate_action_fields(self) -> 'TestStep':
+        """Check the step against its action's entry in ALLOWED_ACTIONS in one pass."""
+        action = self.action
+        required_fields = ALLOWED_ACTIONS.get(action)
+        if required_fields is None:
+            raise ValueError(
+                f"Unknown action '{action}'; action must be one of: {', '.join(sorted(ALLOWED_ACTIONS))}"
+            )
 
-    @validator('action')
-    def validate_action(cls, v):
-        """Ensure action is one of the allowed values."""
-        allowed_actions = {
-            'navigate', 'wait_for_element', 'type', 'click',
-            'assert_element_text', 'assert_element_visible',
-            'assert_no_navigation', 'open_new_tab', 'switch_to_new_tab'
-        }
-        if v not in allowed_actions:
-            raise ValueError(f"action must be one of: {', '.join(sorted(allowed_actions))}")
-        return v
+        missing_fields = [name for name in required_fields if getattr(self, name) is None]
+        if missing_fields:
+            raise ValueError(
+                f"Missing required fields for '{action}': {', '.join(sorted(missing_fields))}"
+            )
 
-    @validator('match')
-    def validate_match(cls, v, values):
-        """Validate match field for assert_element_text actions."""
-        if values.get('action') == 'assert_element_text':
-            if v not in ['equals', 'contains', 'regex']:
-                raise ValueError("match must be 'equals', 'contains', or 'regex' for assert_element_text")
-        return v
+        if self.selector is not None and self.selector_type != 'css':
+            raise ValueError("selector_type must be 'css' when selector is present")
+
+        if action == 'assert_element_text' and self.match not in _MATCH_TYPES:
+            raise ValueError("match must be 'equals', 'contains', or 'regex' for assert_element_text")
+        return self
 
 
 class RainforestTest(BaseModel):
     """Complete Rainforest test specification."""
-    schema_version: str = Field(default="rf-1.0", pattern="^rf-1\.0$")
+    model_config = ConfigDict(frozen=True)
+
+    schema_version: str = Field(default="rf-1.0", pattern=r"^rf-1\.0$")
     title: str = Field(..., min_length=5, max_length=120)
     description: str = Field(..., min_length=20, max_length=400)
-    tags: List[str] = Field(..., min_items=1)
+    tags: List[str] = Field(..., min_length=1)
     environment: Environment
     variables: Optional[List[Variable]] = None
-    steps: List[TestStep] = Field(..., min_items=4, max_items=12)
+    steps: List[TestStep] = Field(..., min_length=4, max_length=12)
     final_result: str = Field(..., min_length=1)
     design_decisions: str = Field(..., min_length=1)
 
-    @validator('tags')
+    @field_validator('tags')
+    @classmethod
     def validate_tags(cls, v):
         """Ensure tags are kebab-case."""
-        kebab_pattern = re.compile(r'^[a-z0-9]+(-[a-z0-9]+)*$')
+        # Fast path: every tag is valid; the count rules out tags containing the separator
+        joined = "\n".join(v) + "\n"
+        if joined.count("\n") == len(v) and _KEBAB_LINES_RE.match(joined):
+            return v
+
+        # Report the first offending tag
         for tag in v:
-            if not kebab_pattern.match(tag):
+            if not _KEBAB_RE.match(tag):
                 raise ValueError(f"Tag '{tag}' must be kebab-case (lowercase, hyphens only)")
         return v
 
-    @validator('design_decisions')
+    @field_validator('design_decisions')
+    @classmethod
     def validate_design_decisions_length(cls, v):
         """Ensure design_decisions is <= 5 sentences."""
         sentences = v.count('.') + v.count('!') + v.count('?')
@@ -94,11 +125,11 @@ class RainforestTest(BaseModel):
             declared_vars = {var.name for var in self.variables}
 
         # Find all {{variable}} references in steps
-        var_pattern = re.compile(r'\{\{(\w+)\}\}')
         for i, step in enumerate(self.steps):
-            for field_name, field_value in step.dict().items():
-                if isinstance(field_value, str):
-                    matches = var_pattern.findall(field_value)
+            for field_name in _STEP_STRING_FIELDS:
+                field_value = getattr(step, field_name)
+                if field_value is not None:
+                    matches = _VAR_RE.findall(field_value)
                     for var_name in matches:
                         if var_name not in declared_vars:
                             errors.append(
@@ -106,16 +137,3 @@ class RainforestTest(BaseModel):
                             )
         return errors
 
-
-ALLOWED_ACTIONS = {
-    'navigate': ['target', 'expected_result'],
-    'wait_for_element': ['selector_type', 'selector', 'timeout_seconds', 'expected_result'],
-    'type': ['selector_type', 'selector', 'value', 'expected_result'],
-    'click': ['selector_type', 'selector', 'expected_result'],
-    'assert_element_text': ['selector_type', 'selector', 'match', 'value', 'expected_result'],
-    'assert_element_visible': ['selector_type', 'selector', 'expected_result'],
-    'assert_no_navigation': ['expected_result'],
-    'open_new_tab': ['target', 'expected_result'],
-    'switch_to_new_tab': ['expected_result'],
-}
-
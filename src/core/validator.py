@@ -1,16 +1,55 @@
 """Validation logic for VibeQA Generator outputs."""
 
-import json
 import re
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple, Optional
-from pydantic import ValidationError
 
-from .schema import RainforestTest, ALLOWED_ACTIONS
+import orjson
+from pydantic import TypeAdapter, ValidationError
+
+from .schema import RainforestTest, Environment, Variable, TestStep, ALLOWED_ACTIONS, _STEP_STRING_FIELDS
+
+
+_TEST_ADAPTER = TypeAdapter(RainforestTest)
+
+# Fields each action may carry, including 'action' itself
+_ACTION_FIELDS = {
+    action: frozenset(fields) | {'action'} for action, fields in ALLOWED_ACTIONS.items()
+}
+
+_FENCE_OPEN_RE = re.compile(r'^```(?:json)?\s*\n', re.MULTILINE)
+_FENCE_CLOSE_RE = re.compile(r'\n```\s*$', re.MULTILINE)
+
+# Pydantic's prefix on messages from ValueErrors raised in validators
+_VALUE_ERROR_PREFIX = "Value error, "
+
+# Shared TestValidator per strict_mode, used by validate_test_json
+_VALIDATOR_CACHE: Dict[bool, 'TestValidator'] = {}
+
+
+@lru_cache(maxsize=256)
+def _strip_code_fences(text: str) -> str:
+    """Remove markdown code fences from a response (memoized for repeated responses)."""
+    if '```' not in text:
+        return text.strip()
+    
+    # Fast path: one fenced block wrapping the whole response
+    if text.startswith('```') and text.endswith('\n```') and text.count('```') == 2:
+        first_newline = text.find('\n')
+        if first_newline < len(text) - 4 and text[3:first_newline].strip() in ('', 'json'):
+            return text[first_newline + 1:-4].strip()
+    
+    # Remove ```json ... ``` or ``` ... ```
+    text = _FENCE_OPEN_RE.sub('', text)
+    text = _FENCE_CLOSE_RE.sub('', text)
+    return text.strip()
 
 
 class ValidationResult:
     """Result of validation with success status and error details."""
     
+    __slots__ = ('success', 'errors', 'warnings')
+    
     def __init__(self, success: bool, errors: Optional[List[str]] = None, 
                  warnings: Optional[List[str]] = None):
         self.success = success
@@ -47,8 +86,8 @@ class TestValidator:
         
         # Parse JSON
         try:
-            parsed_json = json.loads(cleaned_response)
-        except json.JSONDecodeError as e:
+            parsed_json = orjson.loads(cleaned_response)
+        except orjson.JSONDecodeError as e:
             result.add_error(f"Invalid JSON: {str(e)}")
             return None, result
         
@@ -57,16 +96,26 @@ class TestValidator:
     
     def _strip_code_fences(self, text: str) -> str:
         """Remove markdown code fences from response."""
-        # Remove ```json ... ``` or ``` ... ```
-        text = re.sub(r'^```(?:json)?\s*\n', '', text, flags=re.MULTILINE)
-        text = re.sub(r'\n```\s*$', '', text, flags=re.MULTILINE)
-        return text.strip()
+        return _strip_code_fences(text)
     
-    def _validate_parsed_json(self, data: Dict[Any, Any], result: ValidationResult) -> Tuple[Optional[Dict[Any, Any]], ValidationResult]:
-        """Validate parsed JSON against RainforestTest schema."""
+    def _validate_parsed_json(self, data: Dict[Any, Any], result: ValidationResult,
+                              skip_schema: bool = False) -> Tuple[Optional[Dict[Any, Any]], ValidationResult]:
+        """
+        Validate parsed JSON against RainforestTest schema.
+        
+        With skip_schema, the data is assumed to have passed schema validation
+        already: only the structure the cross-checks rely on (environment, known
+        step actions and their required fields, variable names) is checked before
+        the step, variable and strict-mode checks run.
+        """
         try:
             # Create RainforestTest instance for validation
-            test = RainforestTest(**data)
+            if skip_schema:
+                if not self._check_test_structure(data, result):
+                    return None, result
+                test = _construct_test(data)
+            else:
+                test = _TEST_ADAPTER.validate_python(data)
             
             # Additional custom validations
             self._validate_step_actions(test, result)
@@ -84,37 +133,87 @@ class TestValidator:
             
         except ValidationError as e:
             for error in e.errors():
-                field_path = " -> ".join(str(loc) for loc in error['loc'])
-                result.add_error(f"{field_path}: {error['msg']}")
+                loc = error['loc']
+                if len(loc) == 2 and loc[0] == 'steps' and isinstance(loc[1], int):
+                    # Whole-step errors from TestStep.validate_action_fields
+                    message = error['msg']
+                    if message.startswith(_VALUE_ERROR_PREFIX):
+                        message = message[len(_VALUE_ERROR_PREFIX):]
+                    result.add_error(f"Step {loc[1] + 1}: {message}")
+                else:
+                    field_path = " -> ".join(str(part) for part in loc)
+                    result.add_error(f"{field_path}: {error['msg']}")
             return None, result
     
-    def _validate_step_actions(self, test: RainforestTest, result: ValidationResult) -> None:
-        """Validate that each step has the correct fields for its action."""
-        for i, step in enumerate(test.steps):
-            action = step.action
-            step_dict = step.dict(exclude_none=True)
-            
-            if action not in ALLOWED_ACTIONS:
-                result.add_error(f"Step {i+1}: Unknown action '{action}'")
+    def _check_test_structure(self, data: Dict[Any, Any], result: ValidationResult) -> bool:
+        """
+        Report what _construct_test needs when schema validation is skipped.
+        
+        Returns:
+            True if a RainforestTest can be constructed from the data
+        """
+        if not isinstance(data.get('environment'), dict):
+            result.add_error("environment: Field required")
+        
+        variables = data.get('variables')
+        if variables is not None and not (
+                isinstance(variables, list)
+                and all(isinstance(var, dict) and isinstance(var.get('name'), str) for var in variables)):
+            result.add_error("variables: Each variable must be an object with a string name")
+        
+        steps = data.get('steps')
+        if not isinstance(steps, list):
+            result.add_error("steps: Field required")
+            return False
+        
+        for i, step in enumerate(steps):
+            if not isinstance(step, dict):
+                result.add_error(f"Step {i+1}: Step must be an object")
                 continue
             
-            required_fields = set(ALLOWED_ACTIONS[action])
-            present_fields = set(step_dict.keys())
+            action = step.get('action')
+            required_fields = ALLOWED_ACTIONS.get(action) if isinstance(action, str) else None
+            if required_fields is None:
+                result.add_error(
+                    f"Step {i+1}: Unknown action '{action}'; action must be one of: "
+                    f"{', '.join(sorted(ALLOWED_ACTIONS))}"
+                )
+                continue
             
-            # Check for missing required fields
-            missing_fields = required_fields - present_fields
+            missing_fields = [name for name in required_fields if step.get(name) is None]
             if missing_fields:
                 result.add_error(
                     f"Step {i+1}: Missing required fields for '{action}': {', '.join(sorted(missing_fields))}"
                 )
             
-            # In strict mode, check for unexpected fields
-            if self.strict_mode:
-                unexpected_fields = present_fields - required_fields - {'action'}
-                if unexpected_fields:
-                    result.add_error(
-                        f"Step {i+1}: Unexpected fields for '{action}': {', '.join(sorted(unexpected_fields))}"
-                    )
+            # Variable references are searched in these fields, which must be strings
+            non_string_fields = [
+                name for name in _STEP_STRING_FIELDS
+                if step.get(name) is not None and not isinstance(step[name], str)
+            ]
+            if non_string_fields:
+                result.add_error(f"Step {i+1}: Fields must be strings: {', '.join(non_string_fields)}")
+        
+        return result.success
+    
+    def _validate_step_actions(self, test: RainforestTest, result: ValidationResult) -> None:
+        """
+        In strict mode, reject fields a step's action does not use.
+        
+        Unknown actions and missing required fields are already rejected by TestStep.
+        """
+        if not self.strict_mode:
+            return
+        
+        for i, step in enumerate(test.steps):
+            action = step.action
+            present_fields = {name for name in step.model_fields_set if getattr(step, name) is not None}
+            
+            unexpected_fields = present_fields - _ACTION_FIELDS[action]
+            if unexpected_fields:
+                result.add_error(
+                    f"Step {i+1}: Unexpected fields for '{action}': {', '.join(sorted(unexpected_fields))}"
+                )
     
     def _check_unknown_fields(self, data: Dict[Any, Any], result: ValidationResult) -> None:
         """Check for unknown fields in strict mode."""
@@ -136,18 +235,33 @@ class TestValidator:
         return f"You omitted or misformatted: {error_summary}. Return the full JSON object again with all required fields. No prose."
 
 
-def validate_test_json(json_data: Dict[Any, Any], strict_mode: bool = False) -> ValidationResult:
+def _construct_test(data: Dict[Any, Any]) -> RainforestTest:
+    """Build a RainforestTest from already-validated data without re-running validators."""
+    fields = dict(data)
+    fields['environment'] = Environment.model_construct(**data['environment'])
+    fields['steps'] = [TestStep.model_construct(**step) for step in data['steps']]
+    if data.get('variables'):
+        fields['variables'] = [Variable.model_construct(**var) for var in data['variables']]
+    return RainforestTest.model_construct(**fields)
+
+
+def validate_test_json(json_data: Dict[Any, Any], strict_mode: bool = False,
+                       skip_schema: bool = False) -> ValidationResult:
     """
     Convenience function to validate a test JSON object.
     
     Args:
         json_data: The parsed JSON data to validate
         strict_mode: Whether to enforce strict validation
+        skip_schema: Skip pydantic schema validation for data that has already
+            passed it; structural problems are still reported, not raised
     
     Returns:
         ValidationResult with success status and any errors
     """
-    validator = TestValidator(strict_mode=strict_mode)
-    _, result = validator._validate_parsed_json(json_data, ValidationResult(True))
+    validator = _VALIDATOR_CACHE.get(strict_mode)
+    if validator is None:
+        validator = _VALIDATOR_CACHE[strict_mode] = TestValidator(strict_mode=strict_mode)
+    _, result = validator._validate_parsed_json(json_data, ValidationResult(True), skip_schema=skip_schema)
     return result
 
@@ -1,13 +1,12 @@
 """Base framework adapter interface."""
 
-from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Protocol, runtime_checkable
 
 
-class FrameworkAdapter(ABC):
-    """Base class for framework-specific adapters."""
+@runtime_checkable
+class FrameworkAdapter(Protocol):
+    """Interface for framework-specific adapters (structural; subclassing is optional)."""
     
-    @abstractmethod
     def convert(self, test_json: Dict[str, Any]) -> str:
         """
         Convert a test JSON object to framework-specific format.
@@ -18,9 +17,8 @@ class FrameworkAdapter(ABC):
         Returns:
             String representation in the target framework format
         """
-        pass
+        ...
     
-    @abstractmethod
     def get_file_extension(self) -> str:
         """
         Get the file extension for this framework.
@@ -28,10 +26,9 @@ class FrameworkAdapter(ABC):
         Returns:
             File extension including the dot (e.g., '.json', '.cy.js')
         """
-        pass
+        ...
     
     @property
-    @abstractmethod
     def framework_name(self) -> str:
         """Name of the framework."""
-        pass
+        ...
@@ -1,9 +1,65 @@
 """Cypress framework adapter."""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable, Optional
 from .base import FrameworkAdapter
 
 
+def _format_navigate(step: Dict[str, Any]) -> str:
+    target = step['target']
+    if target.startswith('http'):
+        return f"cy.visit('{target}');"
+    return f"cy.visit(baseUrl + '{target}');"
+
+
+# Chai assertion per assert_element_text match type
+_TEXT_MATCH_ASSERTIONS = {
+    'equals': "'have.text', '{value}'",
+    'contains': "'contain.text', '{value}'",
+    'regex': "'match', /{value}/",
+}
+
+
+def _format_assert_text(step: Dict[str, Any]) -> Optional[str]:
+    assertion = _TEXT_MATCH_ASSERTIONS.get(step['match'])
+    if assertion is None:
+        return None
+    return f"cy.get('{step['selector']}').should({assertion.format(value=step['value'])});"
+
+
+# Cypress command per action; None (or an unknown action) emits only the step comment
+_STEP_FORMATTERS: Dict[str, Callable[[Dict[str, Any]], Optional[str]]] = {
+    'navigate': _format_navigate,
+    'wait_for_element': lambda s: (
+        f"cy.get('{s['selector']}', {{ timeout: {s.get('timeout_seconds', 10) * 1000} }}).should('exist');"
+    ),
+    'type': lambda s: f"cy.get('{s['selector']}').type('{s['value']}');",
+    'click': lambda s: f"cy.get('{s['selector']}').click();",
+    'assert_element_text': _format_assert_text,
+    'assert_element_visible': lambda s: f"cy.get('{s['selector']}').should('be.visible');",
+    'assert_no_navigation': lambda s: (
+        "cy.url().should('eq', Cypress.config().baseUrl + Cypress.env('currentPath'));"
+    ),
+    'open_new_tab': lambda s: (
+        "// Note: Cypress doesn't support multiple tabs. "
+        f"Consider using cy.window().then(win => win.open('{s['target']}'));"
+    ),
+    'switch_to_new_tab': lambda s: (
+        "// Note: Cypress doesn't support tab switching. Test should be redesigned for single tab."
+    ),
+}
+
+# Fixed boilerplate around the variables and steps of a generated spec
+_CYPRESS_HEADER = (
+    "// {description}\n"
+    "// Generated by VibeQA Generator\n"
+    "\n"
+    "describe('{title}', () => {{\n"
+    "  const baseUrl = '{base_url}';\n"
+)
+_CYPRESS_IT_OPEN = "\n  it('should {title}', () => {{\n"
+_CYPRESS_FOOTER = "  });\n});"
+
+
 class CypressAdapter(FrameworkAdapter):
     """Adapter for Cypress test format."""
     
@@ -30,93 +86,31 @@ class CypressAdapter(FrameworkAdapter):
         base_url = test_json['environment']['base_url']
         variables = test_json.get('variables', [])
         
-        # Start building the Cypress test
-        lines = [
-            f"// {description}",
-            f"// Generated by VibeQA Generator",
-            "",
-            f"describe('{title}', () => {{",
-            f"  const baseUrl = '{base_url}';",
-        ]
+        parts = [_CYPRESS_HEADER.format(description=description, title=title, base_url=base_url)]
         
         # Add variables if any
         if variables:
-            lines.append("")
-            lines.append("  // Test variables")
-            for var in variables:
-                lines.append(f"  const {var['name']} = '{var['value']}';")
+            parts.append("\n  // Test variables\n")
+            parts.extend([f"  const {var['name']} = '{var['value']}';\n" for var in variables])
         
-        lines.extend([
-            "",
-            f"  it('should {title.lower()}', () => {{",
-        ])
+        parts.append(_CYPRESS_IT_OPEN.format(title=title.lower()))
         
         # Convert each step
-        for i, step in enumerate(steps):
-            step_lines = self._convert_step(step, i + 1)
-            for line in step_lines:
-                lines.append(f"    {line}")
+        for i, step in enumerate(steps, 1):
+            parts.extend([f"    {line}\n" for line in self._convert_step(step, i)])
         
-        lines.extend([
-            "  });",
-            "});"
-        ])
-        
-        return "\n".join(lines)
+        parts.append(_CYPRESS_FOOTER)
+        return "".join(parts)
     
     def _convert_step(self, step: Dict[str, Any], step_number: int) -> List[str]:
         """Convert a single step to Cypress commands."""
-        action = step['action']
-        expected_result = step['expected_result']
-        lines = [f"// Step {step_number}: {expected_result}"]
+        lines = [f"// Step {step_number}: {step['expected_result']}"]
         
-        if action == 'navigate':
-            target = step['target']
-            if target.startswith('http'):
-                lines.append(f"cy.visit('{target}');")
-            else:
-                lines.append(f"cy.visit(baseUrl + '{target}');")
-                
-        elif action == 'wait_for_element':
-            selector = step['selector']
-            timeout = step.get('timeout_seconds', 10) * 1000  # Convert to ms
-            lines.append(f"cy.get('{selector}', {{ timeout: {timeout} }}).should('exist');")
-            
-        elif action == 'type':
-            selector = step['selector']
-            value = step['value']
-            lines.append(f"cy.get('{selector}').type('{value}');")
-            
-        elif action == 'click':
-            selector = step['selector']
-            lines.append(f"cy.get('{selector}').click();")
-            
-        elif action == 'assert_element_text':
-            selector = step['selector']
-            match_type = step['match']
-            value = step['value']
-            
-            if match_type == 'equals':
-                lines.append(f"cy.get('{selector}').should('have.text', '{value}');")
-            elif match_type == 'contains':
-                lines.append(f"cy.get('{selector}').should('contain.text', '{value}');")
-            elif match_type == 'regex':
-                lines.append(f"cy.get('{selector}').should('match', /{value}/);")
-                
-        elif action == 'assert_element_visible':
-            selector = step['selector']
-            lines.append(f"cy.get('{selector}').should('be.visible');")
-            
-        elif action == 'assert_no_navigation':
-            lines.append("cy.url().should('eq', Cypress.config().baseUrl + Cypress.env('currentPath'));")
-            
-        elif action == 'open_new_tab':
-            target = step['target']
-            lines.append(f"// Note: Cypress doesn't support multiple tabs. Consider using cy.window().then(win => win.open('{target}'));")
-            
-        elif action == 'switch_to_new_tab':
-            lines.append("// Note: Cypress doesn't support tab switching. Test should be redesigned for single tab.");
+        formatter = _STEP_FORMATTERS.get(step['action'])
+        if formatter is not None:
+            command = formatter(step)
+            if command is not None:
+                lines.append(command)
         
         lines.append("")  # Add blank line after each step
         return lines
-
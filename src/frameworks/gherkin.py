@@ -1,9 +1,56 @@
 """Gherkin framework adapter."""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable, Optional
 from .base import FrameworkAdapter
 
 
+# Fixed feature layout ahead of the scenario steps
+_FEATURE_HEADER = (
+    "{tags}Feature: {title}\n"
+    "  {description}\n"
+    "\n"
+    "  Background:\n"
+    "    Given the application is running at \"{base_url}\"\n"
+    "\n"
+    "  Scenario: {title}"
+)
+
+_ASSERTION_ACTIONS = frozenset({
+    'assert_element_text', 'assert_element_visible', 'assert_no_navigation'
+})
+
+# assert_element_text phrasing per match type
+_TEXT_MATCH_PHRASES = {
+    'equals': 'should have text',
+    'contains': 'should contain text',
+    'regex': 'should match pattern',
+}
+
+
+def _format_assert_text(step: Dict[str, Any]) -> Optional[str]:
+    phrase = _TEXT_MATCH_PHRASES.get(step['match'])
+    if phrase is None:
+        return None
+    return f"the element \"{step['selector']}\" {phrase} \"{step['value']}\""
+
+
+# Step text (without the Given/When/Then keyword) per action; None falls back
+# to the step's expected_result
+_STEP_FORMATTERS: Dict[str, Callable[[Dict[str, Any]], Optional[str]]] = {
+    'navigate': lambda s: f"I navigate to \"{s['target']}\"",
+    'wait_for_element': lambda s: (
+        f"I wait {s.get('timeout_seconds', 10)} seconds for element \"{s['selector']}\" to appear"
+    ),
+    'type': lambda s: f"I type \"{s['value']}\" into \"{s['selector']}\"",
+    'click': lambda s: f"I click on \"{s['selector']}\"",
+    'assert_element_text': _format_assert_text,
+    'assert_element_visible': lambda s: f"the element \"{s['selector']}\" should be visible",
+    'assert_no_navigation': lambda s: "I should remain on the current page",
+    'open_new_tab': lambda s: f"I open \"{s['target']}\" in a new tab",
+    'switch_to_new_tab': lambda s: "I switch to the new tab",
+}
+
+
 class GherkinAdapter(FrameworkAdapter):
     """Adapter for Gherkin/Cucumber feature format."""
     
@@ -31,30 +78,14 @@ class GherkinAdapter(FrameworkAdapter):
         final_result = test_json['final_result']
         base_url = test_json['environment']['base_url']
         
-        # Start building the feature file
-        lines = []
-        
-        # Add tags
-        if tags:
-            tag_line = " ".join(f"@{tag}" for tag in tags)
-            lines.append(tag_line)
-        
-        lines.extend([
-            f"Feature: {title}",
-            f"  {description}",
-            "",
-            f"  Background:",
-            f"    Given the application is running at \"{base_url}\"",
-            "",
-            f"  Scenario: {title}",
-        ])
+        # Tags line, if any, precedes the fixed feature header
+        tag_prefix = " ".join(f"@{tag}" for tag in tags) + "\n" if tags else ""
+        header = _FEATURE_HEADER.format(tags=tag_prefix, title=title, description=description,
+                                        base_url=base_url)
         
         # Convert steps to Given/When/Then format
         gherkin_steps = self._convert_steps_to_gherkin(steps, final_result)
-        for step in gherkin_steps:
-            lines.append(f"    {step}")
-        
-        return "\n".join(lines)
+        return header + "\n    " + "\n    ".join(gherkin_steps)
     
     def _convert_steps_to_gherkin(self, steps: List[Dict[str, Any]], final_result: str) -> List[str]:
         """Convert test steps to Gherkin Given/When/Then format."""
@@ -63,17 +94,15 @@ class GherkinAdapter(FrameworkAdapter):
         # Determine step types based on position and action
         for i, step in enumerate(steps):
             action = step['action']
-            expected_result = step['expected_result']
             
             if i == 0:
                 keyword = "Given"
-            elif self._is_assertion(action):
+            elif action in _ASSERTION_ACTIONS:
                 keyword = "Then"
             else:
                 keyword = "When"
             
-            gherkin_step = self._convert_single_step(step, keyword)
-            gherkin_steps.append(gherkin_step)
+            gherkin_steps.append(self._convert_single_step(step, keyword, action))
         
         # Add final result as the last Then step if not already covered
         if not any(step.startswith("Then") for step in gherkin_steps[-2:]):
@@ -81,62 +110,14 @@ class GherkinAdapter(FrameworkAdapter):
         
         return gherkin_steps
     
-    def _is_assertion(self, action: str) -> bool:
-        """Check if an action is an assertion."""
-        assertion_actions = {
-            'assert_element_text', 'assert_element_visible', 'assert_no_navigation'
-        }
-        return action in assertion_actions
-    
-    def _convert_single_step(self, step: Dict[str, Any], keyword: str) -> str:
-        """Convert a single step to Gherkin format."""
-        action = step['action']
-        expected_result = step['expected_result']
-        
-        if action == 'navigate':
-            target = step['target']
-            return f"{keyword} I navigate to \"{target}\""
-            
-        elif action == 'wait_for_element':
-            selector = step['selector']
-            timeout = step.get('timeout_seconds', 10)
-            return f"{keyword} I wait {timeout} seconds for element \"{selector}\" to appear"
-            
-        elif action == 'type':
-            selector = step['selector']
-            value = step['value']
-            return f"{keyword} I type \"{value}\" into \"{selector}\""
-            
-        elif action == 'click':
-            selector = step['selector']
-            return f"{keyword} I click on \"{selector}\""
-            
-        elif action == 'assert_element_text':
-            selector = step['selector']
-            match_type = step['match']
-            value = step['value']
-            
-            if match_type == 'equals':
-                return f"{keyword} the element \"{selector}\" should have text \"{value}\""
-            elif match_type == 'contains':
-                return f"{keyword} the element \"{selector}\" should contain text \"{value}\""
-            elif match_type == 'regex':
-                return f"{keyword} the element \"{selector}\" should match pattern \"{value}\""
-                
-        elif action == 'assert_element_visible':
-            selector = step['selector']
-            return f"{keyword} the element \"{selector}\" should be visible"
-            
-        elif action == 'assert_no_navigation':
-            return f"{keyword} I should remain on the current page"
-            
-        elif action == 'open_new_tab':
-            target = step['target']
-            return f"{keyword} I open \"{target}\" in a new tab"
-            
-        elif action == 'switch_to_new_tab':
-            return f"{keyword} I switch to the new tab"
+    def _convert_single_step(self, step: Dict[str, Any], keyword: str,
+                             action: Optional[str] = None) -> str:
+        """Convert a single step to Gherkin format; pass action if already read from step."""
+        formatter = _STEP_FORMATTERS.get(action or step['action'])
+        if formatter is not None:
+            text = formatter(step)
+            if text is not None:
+                return f"{keyword} {text}"
         
         # Fallback to expected result
-        return f"{keyword} {expected_result.lower()}"
-
+        return f"{keyword} {step['expected_result'].lower()}"
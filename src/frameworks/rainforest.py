@@ -1,6 +1,6 @@
 """Rainforest framework adapter."""
 
-import json
+import orjson
 from typing import Dict, Any
 
 from .base import FrameworkAdapter
@@ -28,5 +28,5 @@ class RainforestAdapter(FrameworkAdapter):
         Returns:
             Pretty-printed JSON string
         """
-        return json.dumps(test_json, indent=2, ensure_ascii=False)
+        return orjson.dumps(test_json, option=orjson.OPT_INDENT_2).decode('utf-8')
 
@@ -1,9 +1,72 @@
 """Rainforest AI prompt adapter for human-language test generation."""
 
-from typing import Dict, Any
+import re
+from typing import Dict, Any, Callable, Optional
 from .base import FrameworkAdapter
 
 
+_DATA_TEST_RE = re.compile(r"data-test='([^']*)'")
+
+# Simplified prompt layout, ending with simple guidance for Rainforest AI
+_PROMPT_TEMPLATE = (
+    "Create a test: {title}\n"
+    "Goal: {goal}\n"
+    "Site: {url}\n"
+    "\n"
+    "Steps:\n"
+    "{steps}\n"
+    "\n"
+    "Use data-test selectors when possible.\n"
+    "Include clear validation for each step."
+)
+
+# Selector substrings mapped to readable names, checked in order
+_SELECTOR_KEYWORDS = (
+    ('login', 'login button'),
+    ('submit', 'submit button'),
+    ('email', 'email field'),
+    ('password', 'password field'),
+    ('error', 'error message'),
+    ('button', 'button'),
+    ('input', 'input field'),
+)
+
+
+# assert_element_text sentence templates per match type
+_TEXT_MATCH_TEMPLATES = {
+    'equals': "Verify that element '{selector}' displays exactly '{value}' and {expected}",
+    'contains': "Check that element '{selector}' contains the text '{value}' and {expected}",
+    'regex': "Validate that element '{selector}' matches the pattern '{value}' and {expected}",
+}
+
+
+def _describe_assert_text(step: Dict[str, Any], expected: str) -> Optional[str]:
+    template = _TEXT_MATCH_TEMPLATES.get(step['match'])
+    if template is None:
+        return None
+    return template.format(selector=step['selector'], value=step['value'], expected=expected)
+
+
+# Human-language sentence per action, given the step and its lowercased
+# expected_result; None falls back to a generic sentence
+_HUMAN_STEP_FORMATTERS: Dict[str, Callable[[Dict[str, Any], str], Optional[str]]] = {
+    'navigate': lambda s, e: f"Navigate to '{s['target']}' and verify {e}",
+    'wait_for_element': lambda s, e: (
+        f"Wait up to {s.get('timeout_seconds', 10)} seconds for element '{s['selector']}' "
+        f"to appear, confirming {e}"
+    ),
+    'type': lambda s, e: f"Enter '{s['value']}' into the field '{s['selector']}' and verify {e}",
+    'click': lambda s, e: f"Click on element '{s['selector']}' and confirm {e}",
+    'assert_element_text': _describe_assert_text,
+    'assert_element_visible': lambda s, e: (
+        f"Confirm that element '{s['selector']}' is visible on the page and {e}"
+    ),
+    'assert_no_navigation': lambda s, e: f"Verify that the page does not navigate away and {e}",
+    'open_new_tab': lambda s, e: f"Open '{s['target']}' in a new browser tab and verify {e}",
+    'switch_to_new_tab': lambda s, e: f"Switch focus to the newly opened tab and confirm {e}",
+}
+
+
 class RainforestPromptAdapter(FrameworkAdapter):
     """Adapter for Rainforest AI prompt format (human-readable)."""
     
@@ -36,27 +99,10 @@ class RainforestPromptAdapter(FrameworkAdapter):
         # Simplify and consolidate steps for Rainforest AI limitations
         simplified_steps = self._consolidate_steps(steps)
         
-        # Start building the simplified prompt
-        prompt_parts = []
-        
-        # Concise test description
-        prompt_parts.append(f"Create a test: {title}")
-        prompt_parts.append(f"Goal: {final_result}")
-        prompt_parts.append(f"Site: {base_url}")
-        prompt_parts.append("")
-        
-        # Simplified steps (max 5-6)
-        prompt_parts.append("Steps:")
-        for i, step_desc in enumerate(simplified_steps, 1):
-            prompt_parts.append(f"{i}. {step_desc}")
+        # Simplified steps (max 5-6), numbered
+        steps_text = "\n".join([f"{i}. {step_desc}" for i, step_desc in enumerate(simplified_steps, 1)])
         
-        prompt_parts.append("")
-        
-        # Simple guidance for Rainforest AI
-        prompt_parts.append("Use data-test selectors when possible.")
-        prompt_parts.append("Include clear validation for each step.")
-        
-        return "\n".join(prompt_parts)
+        return _PROMPT_TEMPLATE.format(title=title, goal=final_result, url=base_url, steps=steps_text)
     
     def _consolidate_steps(self, steps: list) -> list:
         """
@@ -65,151 +111,84 @@ class RainforestPromptAdapter(FrameworkAdapter):
         Combines related actions and reduces step count to 4-6 steps maximum.
         """
         consolidated = []
-        i = 0
+        form_actions = []  # pending run of consecutive type steps
+        after_navigate = False
         
-        while i < len(steps):
-            current_step = steps[i]
-            action = current_step['action']
+        for step in steps:
+            action = step['action']
             
-            # Group navigation and initial waits
-            if action == 'navigate':
-                nav_desc = f"Go to {current_step.get('target', 'the application')}"
-                # Look ahead for wait_for_element after navigate
-                if i + 1 < len(steps) and steps[i + 1]['action'] == 'wait_for_element':
-                    i += 1  # Skip the wait step, it's implied
-                consolidated.append(nav_desc)
-                
-            # Group form filling (type actions)
-            elif action == 'type':
+            # Group form filling (type actions) into one step
+            if action == 'type':
+                field_name = self._extract_field_name(step.get('selector', ''))
+                form_actions.append(f"enter '{step.get('value', 'data')}' in {field_name}")
+                after_navigate = False
+                continue
+            
+            if form_actions:
+                consolidated.append(f"Fill form: {', '.join(form_actions)}")
                 form_actions = []
-                while i < len(steps) and steps[i]['action'] == 'type':
-                    step = steps[i]
-                    field_name = self._extract_field_name(step.get('selector', ''))
-                    value = step.get('value', 'data')
-                    form_actions.append(f"enter '{value}' in {field_name}")
-                    i += 1
-                i -= 1  # Back up one since we'll increment at end of loop
-                
-                if len(form_actions) == 1:
-                    consolidated.append(f"Fill form: {form_actions[0]}")
-                else:
-                    consolidated.append(f"Fill form: {', '.join(form_actions)}")
-                    
-            # Group clicks and submissions
-            elif action == 'click':
-                element_name = self._extract_field_name(current_step.get('selector', 'button'))
-                consolidated.append(f"Click {element_name}")
-                
-            # Group assertions and validations
-            elif action in ['assert_element_text', 'assert_element_visible', 'wait_for_element']:
-                if action == 'wait_for_element':
-                    element_name = self._extract_field_name(current_step.get('selector', 'element'))
-                    consolidated.append(f"Wait for {element_name} to appear")
-                elif action == 'assert_element_text':
-                    text = current_step.get('value', 'expected text')
-                    consolidated.append(f"Verify error message contains '{text}'")
-                elif action == 'assert_element_visible':
-                    element_name = self._extract_field_name(current_step.get('selector', 'element'))
-                    consolidated.append(f"Confirm {element_name} is visible")
-                    
-            # Skip redundant waits that follow other actions
-            elif action == 'wait_for_element' and i > 0:
-                # Skip if this is just waiting for something we just interacted with
-                pass
-            else:
-                # Fallback for other actions
-                consolidated.append(current_step.get('expected_result', 'Perform action'))
+                if len(consolidated) >= 6:
+                    break
+            
+            # A wait right after navigation is implied by the navigation
+            if action == 'wait_for_element' and after_navigate:
+                after_navigate = False
+                continue
+            after_navigate = action == 'navigate'
             
-            i += 1
+            consolidated.append(self._describe_consolidated_step(step, action))
             
             # Limit to 6 steps maximum for Rainforest AI
             if len(consolidated) >= 6:
                 break
         
+        if form_actions:
+            consolidated.append(f"Fill form: {', '.join(form_actions)}")
+        
         return consolidated[:6]  # Ensure max 6 steps
     
+    def _describe_consolidated_step(self, step: Dict[str, Any], action: str) -> str:
+        """Describe a single non-form step for the consolidated prompt."""
+        if action == 'navigate':
+            return f"Go to {step.get('target', 'the application')}"
+        if action == 'click':
+            return f"Click {self._extract_field_name(step.get('selector', 'button'))}"
+        if action == 'wait_for_element':
+            return f"Wait for {self._extract_field_name(step.get('selector', 'element'))} to appear"
+        if action == 'assert_element_text':
+            return f"Verify error message contains '{step.get('value', 'expected text')}'"
+        if action == 'assert_element_visible':
+            return f"Confirm {self._extract_field_name(step.get('selector', 'element'))} is visible"
+        
+        # Fallback for other actions
+        return step.get('expected_result', 'Perform action')
+    
     def _extract_field_name(self, selector: str) -> str:
         """Extract a human-readable field name from a CSS selector."""
         if not selector:
             return "element"
             
         # Extract from data-test attributes
-        if 'data-test=' in selector:
-            # Extract the data-test value
-            start = selector.find("data-test='") + len("data-test='")
-            if start > len("data-test='") - 1:
-                end = selector.find("'", start)
-                if end > start:
-                    test_name = selector[start:end]
-                    # Convert kebab-case to readable name
-                    return test_name.replace('-', ' ').replace('_', ' ')
+        match = _DATA_TEST_RE.search(selector)
+        if match and match.group(1):
+            # Convert kebab-case to readable name
+            return match.group(1).replace('-', ' ').replace('_', ' ')
         
         # Fallback extractions
-        if 'login' in selector.lower():
-            return "login button"
-        elif 'submit' in selector.lower():
-            return "submit button"
-        elif 'email' in selector.lower():
-            return "email field"
-        elif 'password' in selector.lower():
-            return "password field"
-        elif 'error' in selector.lower():
-            return "error message"
-        elif 'button' in selector.lower():
-            return "button"
-        elif 'input' in selector.lower():
-            return "input field"
-        else:
-            return "element"
+        selector_lower = selector.lower()
+        for keyword, label in _SELECTOR_KEYWORDS:
+            if keyword in selector_lower:
+                return label
+        return "element"
     
     def _convert_step_to_human_language(self, step: Dict[str, Any], step_number: int) -> str:
         """Convert a JSON step to human-readable language."""
-        action = step['action']
-        expected_result = step['expected_result']
-        
-        if action == 'navigate':
-            target = step['target']
-            return f"Navigate to '{target}' and verify {expected_result.lower()}"
-            
-        elif action == 'wait_for_element':
-            selector = step['selector']
-            timeout = step.get('timeout_seconds', 10)
-            return f"Wait up to {timeout} seconds for element '{selector}' to appear, confirming {expected_result.lower()}"
-            
-        elif action == 'type':
-            selector = step['selector']
-            value = step['value']
-            return f"Enter '{value}' into the field '{selector}' and verify {expected_result.lower()}"
-            
-        elif action == 'click':
-            selector = step['selector']
-            return f"Click on element '{selector}' and confirm {expected_result.lower()}"
-            
-        elif action == 'assert_element_text':
-            selector = step['selector']
-            match_type = step['match']
-            value = step['value']
-            
-            if match_type == 'equals':
-                return f"Verify that element '{selector}' displays exactly '{value}' and {expected_result.lower()}"
-            elif match_type == 'contains':
-                return f"Check that element '{selector}' contains the text '{value}' and {expected_result.lower()}"
-            elif match_type == 'regex':
-                return f"Validate that element '{selector}' matches the pattern '{value}' and {expected_result.lower()}"
-                
-        elif action == 'assert_element_visible':
-            selector = step['selector']
-            return f"Confirm that element '{selector}' is visible on the page and {expected_result.lower()}"
-            
-        elif action == 'assert_no_navigation':
-            return f"Verify that the page does not navigate away and {expected_result.lower()}"
-            
-        elif action == 'open_new_tab':
-            target = step['target']
-            return f"Open '{target}' in a new browser tab and verify {expected_result.lower()}"
-            
-        elif action == 'switch_to_new_tab':
-            return f"Switch focus to the newly opened tab and confirm {expected_result.lower()}"
+        expected_result = step['expected_result'].lower()
+        formatter = _HUMAN_STEP_FORMATTERS.get(step['action'])
+        if formatter is not None:
+            text = formatter(step, expected_result)
+            if text is not None:
+                return text
         
         # Fallback to expected result
-        return f"Perform action and verify {expected_result.lower()}"
+        return f"Perform action and verify {expected_result}"
@@ -4,6 +4,16 @@ from typing import Dict, Any
 from .base import FrameworkAdapter
 
 
+_PROMPT_TEMPLATE = """Test: {title}
+
+Site: {url}
+
+Steps:
+{steps}
+
+Expected: {expected}"""
+
+
 class RainforestSimpleAdapter(FrameworkAdapter):
     """Ultra-simplified adapter for Rainforest AI (maximum 4 steps)."""
     
@@ -35,16 +45,8 @@ class RainforestSimpleAdapter(FrameworkAdapter):
         core_steps = self._extract_core_flow(test_json['steps'])
         
         # Build minimal prompt
-        prompt = f"""Test: {title}
-
-Site: {base_url}
-
-Steps:
-{chr(10).join(f"{i}. {step}" for i, step in enumerate(core_steps, 1))}
-
-Expected: {final_result}"""
-        
-        return prompt
+        step_lines = "\n".join([f"{i}. {step}" for i, step in enumerate(core_steps, 1)])
+        return _PROMPT_TEMPLATE.format(title=title, url=base_url, steps=step_lines, expected=final_result)
     
     def _extract_core_flow(self, steps: list) -> list:
         """Extract the absolute core flow (max 4 steps)."""
@@ -1,45 +1,65 @@
 """Framework adapter registry."""
 
-from typing import Dict, Type, List
+import importlib
+from typing import Any, Dict, Tuple, List, Type
 from .base import FrameworkAdapter
-from .rainforest import RainforestAdapter
-from .rainforest_prompt import RainforestPromptAdapter
-from .rainforest_simple import RainforestSimpleAdapter
-from .cypress import CypressAdapter
-from .gherkin import GherkinAdapter
-
-
-# Registry of available framework adapters
-FRAMEWORK_ADAPTERS: Dict[str, Type[FrameworkAdapter]] = {
-    'rainforest': RainforestAdapter,
-    'rainforest-prompt': RainforestPromptAdapter,
-    'rainforest-simple': RainforestSimpleAdapter,
-    'cypress': CypressAdapter,
-    'gherkin': GherkinAdapter,
+
+
+# Where each framework's adapter lives: name -> (module in this package, class name).
+# Modules are imported on first use so a run only loads the adapters it needs.
+_ADAPTER_MODULES: Dict[str, Tuple[str, str]] = {
+    'rainforest': ('rainforest', 'RainforestAdapter'),
+    'rainforest-prompt': ('rainforest_prompt', 'RainforestPromptAdapter'),
+    'rainforest-simple': ('rainforest_simple', 'RainforestSimpleAdapter'),
+    'cypress': ('cypress', 'CypressAdapter'),
+    'gherkin': ('gherkin', 'GherkinAdapter'),
 }
 
+# Adapters are stateless, so every caller shares one instance per framework
+_ADAPTER_INSTANCES: Dict[str, FrameworkAdapter] = {}
+
+
+def _adapter_class(framework: str) -> Type[FrameworkAdapter]:
+    """Import and return the adapter class for a registered framework."""
+    module_name, class_name = _ADAPTER_MODULES[framework]
+    module = importlib.import_module(f".{module_name}", __package__)
+    return getattr(module, class_name)
+
+
+def __getattr__(name: str) -> Any:
+    """Build FRAMEWORK_ADAPTERS (name -> adapter class) only when something asks for it."""
+    if name == 'FRAMEWORK_ADAPTERS':
+        adapters = {framework: _adapter_class(framework) for framework in _ADAPTER_MODULES}
+        globals()['FRAMEWORK_ADAPTERS'] = adapters
+        return adapters
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def get_adapter(framework: str) -> FrameworkAdapter:
     """
-    Get a framework adapter instance.
+    Get the shared framework adapter instance.
     
     Args:
         framework: Name of the framework
-        
+    
     Returns:
         Framework adapter instance
-        
+    
     Raises:
         ValueError: If framework is not supported
     """
-    if framework not in FRAMEWORK_ADAPTERS:
-        available = ', '.join(sorted(FRAMEWORK_ADAPTERS.keys()))
+    adapter = _ADAPTER_INSTANCES.get(framework)
+    if adapter is not None:
+        return adapter
+    
+    if framework not in _ADAPTER_MODULES:
+        available = ', '.join(sorted(_ADAPTER_MODULES.keys()))
         raise ValueError(f"Unsupported framework '{framework}'. Available: {available}")
     
-    adapter_class = FRAMEWORK_ADAPTERS[framework]
-    return adapter_class()
+    adapter = _ADAPTER_INSTANCES[framework] = _adapter_class(framework)()
+    return adapter
 
 
 def get_available_frameworks() -> List[str]:
     """Get list of available framework names."""
-    return sorted(FRAMEWORK_ADAPTERS.keys())
+    return sorted(_ADAPTER_MODULES.keys())
@@ -1,8 +1,11 @@
 """File I/O utilities for VibeQA Generator."""
 
-import json
+import io
+import tarfile
+import time
+import orjson
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Tuple
 
 
 def write_json_file(data: Dict[str, Any], file_path: Path, pretty: bool = True) -> None:
@@ -15,12 +18,7 @@ def write_json_file(data: Dict[str, Any], file_path: Path, pretty: bool = True)
         pretty: Whether to pretty-print the JSON
     """
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(file_path, 'w', encoding='utf-8') as f:
-        if pretty:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        else:
-            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
 
 
 def read_json_file(file_path: Path) -> Dict[str, Any]:
@@ -35,10 +33,9 @@ def read_json_file(file_path: Path) -> Dict[str, Any]:
         
     Raises:
         FileNotFoundError: If file doesn't exist
-        json.JSONDecodeError: If file contains invalid JSON
+        orjson.JSONDecodeError: If file contains invalid JSON
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return orjson.loads(file_path.read_bytes())
 
 
 def write_text_file(content: str, file_path: Path) -> None:
@@ -50,9 +47,26 @@ def write_text_file(content: str, file_path: Path) -> None:
         file_path: Path to write the file
     """
     file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(content.encode('utf-8'))
+
+
+def write_batch(files: List[Tuple[Path, str]], bundle_path: Path) -> None:
+    """
+    Write many text files into a single uncompressed tar bundle.
     
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    Args:
+        files: (path, content) pairs; paths become the tar member names
+        bundle_path: Tar file to write all files into
+    """
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    mtime = int(time.time())
+    with tarfile.open(bundle_path, 'w') as tar:
+        for file_path, content in files:
+            data = content.encode('utf-8')
+            info = tarfile.TarInfo(Path(file_path).as_posix())
+            info.size = len(data)
+            info.mtime = mtime
+            tar.addfile(info, io.BytesIO(data))
 
 
 def read_text_file(file_path: Path) -> str:
@@ -1,6 +1,27 @@
 """String utilities for file naming and formatting."""
 
 import re
+from functools import lru_cache
+
+
+# Anything that is neither a slug character nor a separator
+_INVALID_CHARS_RE = re.compile(r'[^a-z0-9\s_\-]+')
+# Runs of whitespace, underscores and hyphens collapse to a single hyphen
+_SEPARATOR_RUN_RE = re.compile(r'[\s_\-]+')
+_HYPHEN_RUN_RE = re.compile(r'-+')
+_CAMEL_BOUNDARY_RE = re.compile(r'([a-z0-9])([A-Z])')
+
+# ASCII-only equivalent of the two patterns above for bytes.translate:
+# separators map to '-', every other non-slug byte is deleted
+_ASCII_SEPARATORS = bytes(i for i in range(128) if _SEPARATOR_RUN_RE.match(chr(i)))
+_ASCII_SLUG_TABLE = bytes.maketrans(_ASCII_SEPARATORS, b'-' * len(_ASCII_SEPARATORS))
+_ASCII_INVALID = bytes(
+    i for i in range(128)
+    if i not in _ASCII_SEPARATORS and not (ord('a') <= i <= ord('z') or ord('0') <= i <= ord('9'))
+)
+
+
+@lru_cache(maxsize=1024)
 def slugify(text: str) -> str:
     """
     Convert text to a URL-friendly slug.
@@ -14,14 +35,16 @@ def slugify(text: str) -> str:
     # Convert to lowercase
     text = text.lower()
     
-    # Replace spaces and underscores with hyphens
-    text = re.sub(r'[\s_]+', '-', text)
+    # ASCII fast path: map separators and drop invalid characters in one C-level pass
+    if text.isascii():
+        text = text.encode('ascii').translate(_ASCII_SLUG_TABLE, _ASCII_INVALID).decode('ascii')
+        return _HYPHEN_RUN_RE.sub('-', text).strip('-')
     
-    # Remove non-alphanumeric characters except hyphens
-    text = re.sub(r'[^a-z0-9\-]', '', text)
+    # Remove characters other than alphanumerics and separators
+    text = _INVALID_CHARS_RE.sub('', text)
     
-    # Remove multiple consecutive hyphens
-    text = re.sub(r'-+', '-', text)
+    # Replace each run of spaces, underscores and hyphens with one hyphen
+    text = _SEPARATOR_RUN_RE.sub('-', text)
     
     # Strip hyphens from start and end
     text = text.strip('-')
@@ -55,6 +78,7 @@ def snake_to_kebab(text: str) -> str:
     return text.replace('_', '-')
 
 
+@lru_cache(maxsize=1024)
 def camel_to_kebab(text: str) -> str:
     """
     Convert camelCase or PascalCase to kebab-case.
@@ -65,11 +89,16 @@ def camel_to_kebab(text: str) -> str:
     Returns:
         kebab-case string
     """
+    # Already lowercase: no boundaries to insert and nothing to lower
+    if text.islower():
+        return text
+    
     # Insert hyphens before capital letters
-    text = re.sub(r'([a-z0-9])([A-Z])', r'\1-\2', text)
+    text = _CAMEL_BOUNDARY_RE.sub(r'\1-\2', text)
     return text.lower()
 
 
+@lru_cache(maxsize=1024)
 def normalize_tag(tag: str) -> str:
     """
     Normalize a tag to kebab-case format.
@@ -83,7 +112,9 @@ def normalize_tag(tag: str) -> str:
     # Handle different input formats
     if '_' in tag:
         tag = snake_to_kebab(tag)
-    elif any(c.isupper() for c in tag):
+    # islower() rules out uppercase in one C-level pass for typical lowercase tags;
+    # the per-character scan only runs for the rest (digits-only, mixed case, ...)
+    elif not tag.islower() and any(c.isupper() for c in tag):
         tag = camel_to_kebab(tag)
     else:
         tag = slugify(tag)
@@ -0,0 +1,28 @@
+"""Shared fixtures for the test suite."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.core.cache import ResponseCache
+from src.core.engine import PromptEngine
+
+
+SAMPLE_TEST_PATH = Path(__file__).parent / "invalid_password.json"
+
+
+@pytest.fixture
+def sample_test_json():
+    """Valid test JSON fixture."""
+    with open(SAMPLE_TEST_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def stub_engine(tmp_path, monkeypatch):
+    """Engine with a private cache directory and run logging disabled."""
+    engine = PromptEngine(api_key="test-key")
+    engine.cache = ResponseCache(tmp_path / "cache")
+    monkeypatch.setattr(engine, "_log_run", lambda log_data: None)
+    return engine
@@ -0,0 +1,78 @@
+"""Stand-ins for the OpenAI client used by the engine and CLI tests."""
+
+import asyncio
+from types import SimpleNamespace
+
+
+def reply_events(response_id, text):
+    """Events of a successful streamed response."""
+    return [
+        SimpleNamespace(type='response.created', response=SimpleNamespace(id=response_id)),
+        SimpleNamespace(type='response.output_text.delta', delta=text),
+    ]
+
+
+class StubStream:
+    """Stream of Responses API events for one canned reply."""
+    
+    def __init__(self, responses, events):
+        self._responses = responses
+        self._events = events
+    
+    def __iter__(self):
+        return iter(self._events)
+    
+    def close(self):
+        self._responses.in_flight -= 1
+
+
+class StubResponses:
+    """
+    Records each request and replays replies in order.
+    
+    A reply is a (response_id, text) tuple, a list of raw events, or an
+    exception to raise from create.
+    """
+    
+    stream_class = StubStream
+    
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    def create(self, **params):
+        self.requests.append(params)
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return self.stream_class(self, reply if isinstance(reply, list) else reply_events(*reply))
+
+
+class AsyncStubStream(StubStream):
+    """Async variant that yields to the event loop between events."""
+    
+    async def __aiter__(self):
+        for event in self._events:
+            await asyncio.sleep(0)
+            yield event
+    
+    async def close(self):
+        super().close()
+
+
+class AsyncStubResponses(StubResponses):
+    """Async variant of StubResponses."""
+    
+    stream_class = AsyncStubStream
+    
+    async def create(self, **params):
+        return super().create(**params)
+
+
+def stub_client(replies, responses_class=StubResponses):
+    """Client whose responses.create replays the given replies."""
+    return SimpleNamespace(responses=responses_class(replies))
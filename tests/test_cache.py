@@ -0,0 +1,39 @@
+"""Unit tests for the response cache."""
+
+import pytest
+
+from src.core.cache import ResponseCache
+
+
+class TestResponseCache:
+    """Tests for ResponseCache class."""
+    
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a cache in a temporary directory."""
+        return ResponseCache(cache_dir=tmp_path / "cache")
+    
+    def test_key_is_deterministic(self):
+        """Test that key ordering does not affect the cache key."""
+        key_a = ResponseCache.make_key({"model": "gpt-4o", "temperature": 0.2})
+        key_b = ResponseCache.make_key({"temperature": 0.2, "model": "gpt-4o"})
+        assert key_a == key_b
+    
+    def test_key_changes_with_request(self):
+        """Test that different requests get different keys."""
+        key_a = ResponseCache.make_key({"model": "gpt-4o", "temperature": 0.2})
+        key_b = ResponseCache.make_key({"model": "gpt-4o", "temperature": 0.3})
+        assert key_a != key_b
+    
+    def test_miss_returns_none(self, cache):
+        """Test that an unknown key is a miss."""
+        assert cache.get("missing") is None
+    
+    def test_put_then_get(self, cache):
+        """Test round-tripping a response through the cache."""
+        cache.put("abc", '{"title": "Cached"}')
+        assert cache.get("abc") == '{"title": "Cached"}'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
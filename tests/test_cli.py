@@ -0,0 +1,53 @@
+"""Unit tests for the CLI batch path, run against a stubbed OpenAI client."""
+
+import asyncio
+import json
+import tarfile
+
+import pytest
+
+from src.cli import _process_batch
+from src.frameworks.registry import get_adapter
+
+from tests.stubs import AsyncStubResponses, stub_client
+
+
+class TestProcessBatch:
+    """Tests for _process_batch."""
+    
+    def test_process_batch(self, stub_engine, sample_test_json, tmp_path):
+        """Test that the batch path writes one file per scenario within the concurrency limit."""
+        scenarios = ["First scenario", "Second scenario", "Third scenario"]
+        stub_engine.async_client = stub_client(
+            [(f"resp_{i}", json.dumps(sample_test_json)) for i in range(len(scenarios))],
+            AsyncStubResponses)
+        output_dir = tmp_path / "out"
+        
+        asyncio.run(_process_batch(stub_engine, get_adapter('gherkin'), scenarios, output_dir,
+                                   None, False, True, 2))
+        
+        assert sorted(p.name for p in output_dir.iterdir()) == [
+            "first-scenario.feature", "second-scenario.feature", "third-scenario.feature"]
+        assert stub_engine.async_client.responses.max_in_flight == 2
+    
+    def test_process_batch_bundle(self, stub_engine, sample_test_json, tmp_path):
+        """Test that --bundle collects every output into one tar file in scenario order."""
+        scenarios = ["First scenario", "Second scenario"]
+        stub_engine.async_client = stub_client(
+            [(f"resp_{i}", json.dumps(sample_test_json)) for i in range(len(scenarios))],
+            AsyncStubResponses)
+        adapter = get_adapter('gherkin')
+        bundle_path = tmp_path / "bundle.tar"
+        
+        asyncio.run(_process_batch(stub_engine, adapter, scenarios, tmp_path / "out",
+                                   None, False, True, 2, bundle_path))
+        
+        assert not (tmp_path / "out").exists()
+        with tarfile.open(bundle_path) as tar:
+            assert tar.getnames() == ["first-scenario.feature", "second-scenario.feature"]
+            content = tar.extractfile("first-scenario.feature").read().decode('utf-8')
+        assert content == adapter.convert(sample_test_json)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
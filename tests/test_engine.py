@@ -0,0 +1,221 @@
+"""Unit tests for engine helpers that don't need the OpenAI API."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.engine import JsonObjectScanner, PromptEngine
+
+from tests.stubs import AsyncStubResponses, reply_events, stub_client
+
+
+class TestJsonObjectScanner:
+    """Tests for JsonObjectScanner class."""
+    
+    def test_detects_complete_object_across_chunks(self):
+        """Test that completion is reported on the closing brace."""
+        scanner = JsonObjectScanner()
+        assert scanner.feed('{"a": {"b"') is False
+        assert scanner.feed(': 1}') is False
+        assert scanner.feed('}') is True
+        assert scanner.text == '{"a": {"b": 1}}'
+    
+    def test_ignores_braces_inside_strings(self):
+        """Test that braces and escaped quotes in strings don't affect depth."""
+        scanner = JsonObjectScanner()
+        assert scanner.feed('{"a": "x}\\"}"') is False
+        assert scanner.feed('}') is True
+    
+    def test_truncates_trailing_text(self):
+        """Test that text after the closing brace is dropped."""
+        scanner = JsonObjectScanner()
+        assert scanner.feed('```json\n{"a": 1}\n```') is True
+        assert scanner.text == '```json\n{"a": 1}'
+        assert scanner.feed('more') is True
+        assert scanner.text == '```json\n{"a": 1}'
+
+
+class TestLocalRepair:
+    """Tests for PromptEngine._try_local_repair."""
+    
+    @pytest.fixture
+    def engine(self):
+        """Create an engine without contacting the API."""
+        return PromptEngine(api_key="test-key")
+    
+    def test_repairs_trailing_commas(self, engine, sample_test_json):
+        """Test that trailing commas are removed locally."""
+        raw_response = json.dumps(sample_test_json, indent=2).replace('\n  ]', ',\n  ]')
+        assert engine.validator.validate_raw_response(raw_response)[0] is None
+        
+        repaired = engine._try_local_repair(raw_response, None, False)
+        assert repaired is not None
+        assert repaired[1].success is True
+    
+    def test_trailing_comma_repair_leaves_strings_alone(self, engine, sample_test_json):
+        """Test that ',]' and ',}' inside string values survive the trailing-comma repair."""
+        sample_test_json['steps'][1]['selector'] = "[data-test='amount,]']"
+        sample_test_json['final_result'] = "Totals match the pattern [0-9,]+ and {a,}"
+        raw_response = "```json\n" + json.dumps(sample_test_json, indent=2).replace('\n  ]', ',\n  ]') + "\n```"
+        
+        repaired = engine._try_local_repair(raw_response, None, False)
+        assert repaired is not None
+        assert repaired[0]['steps'][1]['selector'] == "[data-test='amount,]']"
+        assert repaired[0]['final_result'] == "Totals match the pattern [0-9,]+ and {a,}"
+    
+    def test_injects_missing_base_url(self, engine, sample_test_json):
+        """Test that a missing base_url is filled from the caller."""
+        del sample_test_json['environment']['base_url']
+        
+        repaired = engine._try_local_repair(json.dumps(sample_test_json), "https://app.test", False)
+        assert repaired is not None
+        assert repaired[0]['environment']['base_url'] == "https://app.test"
+    
+    def test_unrepairable_response(self, engine):
+        """Test that garbage is left for the LLM retry."""
+        assert engine._try_local_repair("not json", "https://app.test", False) is None
+
+
+class TestPrepareRun:
+    """Tests for PromptEngine._prepare_run."""
+    
+    def test_run_ids_are_unique_and_sortable(self, stub_engine):
+        """Test that back-to-back runs get distinct IDs in start order."""
+        run_ids = [stub_engine._prepare_run("Scenario", None, None, None)[1]['run_id'] for _ in range(50)]
+        assert len(set(run_ids)) == len(run_ids)
+        assert run_ids == sorted(run_ids)
+
+
+class TestGenerateTest:
+    """Tests for the sync and async generation paths against a stubbed client."""
+    
+    def test_sync_retries_after_invalid_response(self, stub_engine, sample_test_json):
+        """Test that an unrepairable response is retried and the retry result returned."""
+        stub_engine.client = stub_client([("resp_1", "not json"), ("resp_2", json.dumps(sample_test_json))])
+        
+        test_json = stub_engine.generate_test("Login fails with a bad password")
+        
+        assert test_json['title'] == sample_test_json['title']
+        assert len(stub_engine.client.responses.requests) == 2
+        assert stub_engine.last_cache_hit is False
+    
+    def test_async_matches_sync(self, stub_engine, sample_test_json):
+        """Test that the async path sends the same requests and returns the same test."""
+        replies = [("resp_1", "not json"), ("resp_2", json.dumps(sample_test_json))]
+        stub_engine.client = stub_client(replies)
+        stub_engine.async_client = stub_client(replies, AsyncStubResponses)
+        
+        sync_json = stub_engine.generate_test("Login fails with a bad password", no_cache=True)
+        async_json = asyncio.run(stub_engine.generate_test_async("Login fails with a bad password",
+                                                                 no_cache=True))
+        
+        assert async_json == sync_json
+        assert stub_engine.async_client.responses.requests == stub_engine.client.responses.requests
+    
+    def test_generation_error_is_reported(self, stub_engine):
+        """Test that a failing completion surfaces as ValueError."""
+        stub_engine.async_client = stub_client([RuntimeError("boom")], AsyncStubResponses)
+        
+        with pytest.raises(ValueError, match="Failed to generate test: boom"):
+            asyncio.run(stub_engine.generate_test_async("Login fails with a bad password"))
+
+
+class TestRetryInput:
+    """Tests for what the correction retry sends."""
+    
+    SCENARIO = "Login fails with a bad password"
+    
+    def test_chained_retry_sends_only_correction(self, stub_engine, sample_test_json):
+        """Test that the retry references the first response instead of resending it."""
+        stub_engine.client = stub_client([("resp_1", "not json"), ("resp_2", json.dumps(sample_test_json))])
+        
+        stub_engine.generate_test(self.SCENARIO)
+        
+        first, retry = stub_engine.client.responses.requests
+        assert 'previous_response_id' not in first
+        assert retry['previous_response_id'] == "resp_1"
+        assert len(retry['input']) == 1
+        assert retry['input'][0]['role'] == "user"
+    
+    def test_cache_hit_retry_sends_full_conversation(self, stub_engine, sample_test_json):
+        """Test that a rejected cached response is retried with the whole conversation."""
+        cache_key = stub_engine._prepare_run(self.SCENARIO, None, None, None)[2]
+        stub_engine.cache.put(cache_key, "not json")
+        stub_engine.client = stub_client([("resp_2", json.dumps(sample_test_json))])
+        
+        stub_engine.generate_test(self.SCENARIO)
+        
+        (retry,) = stub_engine.client.responses.requests
+        assert 'previous_response_id' not in retry
+        assert [m['role'] for m in retry['input']] == ["system", "user", "user", "assistant", "user"]
+        assert retry['input'][3]['content'] == "not json"
+    
+    def test_failed_chained_retry_falls_back_to_full_conversation(self, stub_engine, sample_test_json):
+        """Test that a rejected previous_response_id is replaced by the full conversation."""
+        stub_engine.client = stub_client([
+            ("resp_1", "not json"),
+            RuntimeError("previous response not found"),
+            ("resp_3", json.dumps(sample_test_json)),
+        ])
+        
+        test_json = stub_engine.generate_test(self.SCENARIO)
+        
+        assert test_json['title'] == sample_test_json['title']
+        _, chained, fallback = stub_engine.client.responses.requests
+        assert chained['previous_response_id'] == "resp_1"
+        assert 'previous_response_id' not in fallback
+        assert len(fallback['input']) == 5
+    
+    def test_missing_step_field_triggers_retry(self, stub_engine, sample_test_json):
+        """Test that a step missing a required field is sent back to the model for correction."""
+        incomplete = json.loads(json.dumps(sample_test_json))
+        del incomplete['steps'][0]['target']
+        stub_engine.client = stub_client([("resp_1", json.dumps(incomplete)),
+                                           ("resp_2", json.dumps(sample_test_json))])
+        
+        test_json = stub_engine.generate_test(self.SCENARIO)
+        
+        assert test_json['steps'][0]['target'] == sample_test_json['steps'][0]['target']
+        _, retry = stub_engine.client.responses.requests
+        assert "Step 1: Missing required fields for 'navigate': target" in retry['input'][0]['content']
+    
+    def test_failed_response_event_is_an_error(self, stub_engine):
+        """Test that a response.failed event fails the call instead of returning empty text."""
+        failed = SimpleNamespace(type='response.failed', response=SimpleNamespace(
+            id="resp_1", error=SimpleNamespace(code="server_error", message="The model crashed")))
+        stub_engine.client = stub_client([reply_events("resp_1", "")[:1] + [failed]])
+        
+        with pytest.raises(ValueError, match="Failed to generate test: Response failed: The model crashed"):
+            stub_engine.generate_test(self.SCENARIO)
+        assert len(stub_engine.client.responses.requests) == 1
+    
+    def test_failed_chained_retry_event_falls_back(self, stub_engine, sample_test_json):
+        """Test that a failed chained retry stream goes straight to the full-conversation fallback."""
+        failed = SimpleNamespace(type='response.failed', response=SimpleNamespace(
+            id="resp_2", error=SimpleNamespace(code="server_error", message="The model crashed")))
+        stub_engine.async_client = stub_client([
+            ("resp_1", "not json"),
+            [failed],
+            ("resp_3", json.dumps(sample_test_json)),
+        ], AsyncStubResponses)
+        
+        test_json = asyncio.run(stub_engine.generate_test_async(self.SCENARIO))
+        
+        assert test_json['title'] == sample_test_json['title']
+        _, chained, fallback = stub_engine.async_client.responses.requests
+        assert chained['previous_response_id'] == "resp_1"
+        assert 'previous_response_id' not in fallback
+    
+    def test_failed_fallback_is_reported(self, stub_engine):
+        """Test that the error is surfaced when the fallback retry also fails."""
+        stub_engine.client = stub_client([
+            ("resp_1", "not json"), RuntimeError("gone"), RuntimeError("still down")])
+        
+        with pytest.raises(ValueError, match="Failed to generate test on retry: still down"):
+            stub_engine.generate_test(self.SCENARIO)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,40 @@
+"""Unit tests for file I/O utilities."""
+
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from src.utils.file_io import write_batch
+
+
+class TestWriteBatch:
+    """Tests for write_batch function."""
+    
+    def test_writes_tar_bundle(self, tmp_path):
+        """Test that every file becomes a tar member with its content."""
+        bundle_path = tmp_path / "out" / "bundle.tar"
+        files = [
+            (Path("login.feature"), "Feature: Login\n"),
+            (Path("nested") / "signup.feature", "Feature: Signup ✓\n"),
+        ]
+        
+        write_batch(files, bundle_path)
+        
+        with tarfile.open(bundle_path) as tar:
+            assert tar.getnames() == ["login.feature", "nested/signup.feature"]
+            contents = [tar.extractfile(name).read().decode('utf-8') for name in tar.getnames()]
+        assert contents == ["Feature: Login\n", "Feature: Signup ✓\n"]
+    
+    def test_empty_bundle(self, tmp_path):
+        """Test that an empty batch still produces a valid tar file."""
+        bundle_path = tmp_path / "empty.tar"
+        
+        write_batch([], bundle_path)
+        
+        with tarfile.open(bundle_path) as tar:
+            assert tar.getnames() == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
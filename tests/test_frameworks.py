@@ -32,6 +32,13 @@ class TestFrameworkRegistry:
         adapter = get_adapter('gherkin')
         assert isinstance(adapter, GherkinAdapter)
     
+    def test_framework_adapters_maps_to_classes(self):
+        """Test that FRAMEWORK_ADAPTERS still maps each framework to its adapter class."""
+        assert sorted(FRAMEWORK_ADAPTERS) == get_available_frameworks()
+        assert FRAMEWORK_ADAPTERS['rainforest'] is RainforestAdapter
+        assert FRAMEWORK_ADAPTERS['cypress'] is CypressAdapter
+        assert FRAMEWORK_ADAPTERS['gherkin'] is GherkinAdapter
+    
     def test_get_adapter_invalid_framework(self):
         """Test getting adapter for invalid framework."""
         with pytest.raises(ValueError, match="Unsupported framework"):
@@ -2,11 +2,61 @@
 
 import pytest
 import json
+import orjson
 from typing import Dict, Any
 
 from src.core.validator import TestValidator, ValidationResult, validate_test_json
 
 
+@pytest.fixture(scope="module")
+def _valid_test_json_bytes() -> bytes:
+    """Valid test JSON, serialized once per module."""
+    return orjson.dumps({
+        "schema_version": "rf-1.0",
+        "title": "Valid test scenario",
+        "description": "This is a valid test description that meets the minimum length requirement.",
+        "tags": ["auth", "positive"],
+        "environment": {
+            "app_type": "web",
+            "base_url": "https://example.com"
+        },
+        "steps": [
+            {
+                "action": "navigate",
+                "target": "/login",
+                "expected_result": "Login page loads"
+            },
+            {
+                "action": "type",
+                "selector_type": "css",
+                "selector": "[data-test='email']",
+                "value": "test@example.com",
+                "expected_result": "Email is entered"
+            },
+            {
+                "action": "click",
+                "selector_type": "css",
+                "selector": "[data-test='submit']",
+                "expected_result": "Form is submitted"
+            },
+            {
+                "action": "assert_element_visible",
+                "selector_type": "css",
+                "selector": "[data-test='dashboard']",
+                "expected_result": "Dashboard is visible"
+            }
+        ],
+        "final_result": "User successfully logs in",
+        "design_decisions": "Used data-test selectors for reliability."
+    })
+
+
+@pytest.fixture
+def valid_test_json(_valid_test_json_bytes) -> Dict[str, Any]:
+    """Valid test JSON fixture; a fresh copy per test, so tests may mutate it."""
+    return orjson.loads(_valid_test_json_bytes)
+
+
 class TestValidationResult:
     """Tests for ValidationResult class."""
     
@@ -40,48 +90,6 @@ class TestTestValidator:
         """Create a validator instance."""
         return TestValidator()
     
-    @pytest.fixture
-    def valid_test_json(self) -> Dict[str, Any]:
-        """Valid test JSON fixture."""
-        return {
-            "schema_version": "rf-1.0",
-            "title": "Valid test scenario",
-            "description": "This is a valid test description that meets the minimum length requirement.",
-            "tags": ["auth", "positive"],
-            "environment": {
-                "app_type": "web",
-                "base_url": "https://example.com"
-            },
-            "steps": [
-                {
-                    "action": "navigate",
-                    "target": "/login",
-                    "expected_result": "Login page loads"
-                },
-                {
-                    "action": "type",
-                    "selector_type": "css",
-                    "selector": "[data-test='email']",
-                    "value": "test@example.com",
-                    "expected_result": "Email is entered"
-                },
-                {
-                    "action": "click",
-                    "selector_type": "css",
-                    "selector": "[data-test='submit']",
-                    "expected_result": "Form is submitted"
-                },
-                {
-                    "action": "assert_element_visible",
-                    "selector_type": "css",
-                    "selector": "[data-test='dashboard']",
-                    "expected_result": "Dashboard is visible"
-                }
-            ],
-            "final_result": "User successfully logs in",
-            "design_decisions": "Used data-test selectors for reliability."
-        }
-    
     def test_valid_fixture_passes_validation(self, validator, valid_test_json):
         """Test that valid fixture passes validation."""
         _, result = validator._validate_parsed_json(valid_test_json, ValidationResult(True))
@@ -114,6 +122,22 @@ class TestTestValidator:
         assert result.success is False
         assert any("selector_type" in error for error in result.errors)
     
+    def test_selector_type_must_be_css(self, validator, valid_test_json):
+        """Test that a non-css selector_type is rejected with the step number."""
+        valid_test_json['steps'][1]['selector_type'] = 'xpath'
+        
+        parsed, result = validator._validate_parsed_json(valid_test_json, ValidationResult(True))
+        assert parsed is None
+        assert result.errors == ["Step 2: selector_type must be 'css' when selector is present"]
+    
+    def test_missing_step_field_fails(self, validator, valid_test_json):
+        """Test that a step missing a field its action requires is rejected by the schema."""
+        del valid_test_json['steps'][1]['value']
+        
+        parsed, result = validator._validate_parsed_json(valid_test_json, ValidationResult(True))
+        assert parsed is None
+        assert result.errors == ["Step 2: Missing required fields for 'type': value"]
+    
     def test_steps_length_validation(self, validator, valid_test_json):
         """Test that steps length is validated."""
         # Too few steps
@@ -199,6 +223,56 @@ class TestConvenienceFunction:
         invalid_json = {"invalid": "data"}
         result = validate_test_json(invalid_json)
         assert result.success is False
+    
+    def test_skip_schema_accepts_valid_json(self, valid_test_json):
+        """Test that the skip_schema path passes already-valid data."""
+        assert validate_test_json(valid_test_json, strict_mode=True, skip_schema=True).success is True
+    
+    def test_skip_schema_reports_unknown_action(self, valid_test_json):
+        """Test that an unknown action is reported instead of raising in strict mode."""
+        valid_test_json['steps'][2]['action'] = 'hover'
+        
+        result = validate_test_json(valid_test_json, strict_mode=True, skip_schema=True)
+        assert result.success is False
+        assert any(error.startswith("Step 3: Unknown action 'hover'") for error in result.errors)
+    
+    def test_skip_schema_reports_missing_fields(self, valid_test_json):
+        """Test that missing required step fields are reported."""
+        del valid_test_json['steps'][1]['value']
+        
+        result = validate_test_json(valid_test_json, skip_schema=True)
+        assert result.success is False
+        assert "Step 2: Missing required fields for 'type': value" in result.errors
+    
+    def test_skip_schema_reports_non_string_field(self, valid_test_json):
+        """Test that a non-string step value is reported instead of raising."""
+        valid_test_json['steps'][1]['value'] = 5
+        
+        result = validate_test_json(valid_test_json, skip_schema=True)
+        assert result.success is False
+        assert "Step 2: Fields must be strings: value" in result.errors
+    
+    def test_skip_schema_reports_non_string_variable_name(self, valid_test_json):
+        """Test that a variable without a string name is reported instead of raising."""
+        valid_test_json['variables'] = [{"name": ["email"], "value": "a@b.c"}]
+        
+        result = validate_test_json(valid_test_json, skip_schema=True)
+        assert result.success is False
+        assert "variables: Each variable must be an object with a string name" in result.errors
+    
+    def test_skip_schema_reports_missing_environment(self, valid_test_json):
+        """Test that a missing environment is reported instead of raising."""
+        del valid_test_json['environment']
+        
+        result = validate_test_json(valid_test_json, skip_schema=True)
+        assert result.success is False
+        assert "environment: Field required" in result.errors
+    
+    def test_skip_schema_reports_missing_steps(self):
+        """Test that data without steps is reported instead of raising."""
+        result = validate_test_json({"invalid": "data"}, skip_schema=True)
+        assert result.success is False
+        assert "steps: Field required" in result.errors
 
 
 if __name__ == '__main__':
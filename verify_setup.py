@@ -4,8 +4,31 @@
 import os
 import sys
 import json
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # verification may run before dependencies are installed
+    _json_loads = json.loads
+
+
+@lru_cache(maxsize=None)
+def _dir_entries(dir_path: str) -> frozenset:
+    """Names in a directory, listed once with os.scandir (empty if it is missing)."""
+    try:
+        with os.scandir(dir_path or ".") as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _exists(path: str) -> bool:
+    """Check a relative path against its parent directory's cached listing."""
+    parent, _, name = path.rpartition("/")
+    return name in _dir_entries(parent)
+
 
 def check_structure():
     """Verify project structure."""
@@ -22,17 +45,18 @@ def check_structure():
         "pyproject.toml", "README.md", "LICENSE",
         "requirements.txt", "src/cli.py",
         "src/core/engine.py", "src/core/validator.py", "src/core/schema.py",
-        "prompts/system_prompt_v1.txt", "prompts/user_prompt_template_v1.txt"
+        "prompts/system_prompt_v1.txt", "prompts/user_prompt_static_v1.txt",
+        "prompts/user_prompt_dynamic_v1.txt"
     ]
     
     missing = []
     
     for dir_path in required_dirs:
-        if not Path(dir_path).exists():
+        if not _exists(dir_path):
             missing.append(f"Directory: {dir_path}")
     
     for file_path in required_files:
-        if not Path(file_path).exists():
+        if not _exists(file_path):
             missing.append(f"File: {file_path}")
     
     if missing:
@@ -56,13 +80,13 @@ def check_examples():
     missing = []
     
     for scenario in example_scenarios:
-        input_file = Path(f"examples/inputs/{scenario}.txt")
-        if not input_file.exists():
+        input_file = f"examples/inputs/{scenario}.txt"
+        if not _exists(input_file):
             missing.append(f"Input: {input_file}")
         
         for framework in frameworks:
-            output_file = Path(f"examples/outputs/{framework}/{scenario}{extensions[framework]}")
-            if not output_file.exists():
+            output_file = f"examples/outputs/{framework}/{scenario}{extensions[framework]}"
+            if not _exists(output_file):
                 missing.append(f"Output: {output_file}")
     
     if missing:
@@ -87,8 +111,7 @@ def check_golden_outputs():
     
     for json_file in rainforest_files:
         try:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
+            data = _json_loads(json_file.read_bytes())
             
             # Basic validation
             required_fields = ["schema_version", "title", "description", "tags", "environment", "steps", "final_result", "design_decisions"]